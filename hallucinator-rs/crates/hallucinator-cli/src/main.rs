@@ -1,4 +1,4 @@
-use std::io::Write;
+use std::io::{BufWriter, LineWriter, Write};
 use std::path::PathBuf;
 use std::sync::{Arc, Mutex};
 
@@ -485,11 +485,7 @@ async fn check(
     let use_color = !no_color && output.is_none();
     let color = ColorMode(use_color);
 
-    let mut writer: Box<dyn Write> = if let Some(ref output_path) = output {
-        Box::new(std::fs::File::create(output_path)?)
-    } else {
-        Box::new(std::io::stdout())
-    };
+    let mut writer = open_report_writer(output.as_deref())?;
 
     // Open offline DBLP database if configured
     let dblp_offline_db = if let Some(ref path) = dblp_offline_path {
@@ -613,7 +609,7 @@ async fn check(
         None
     };
 
-    if !file_path.exists() {
+    if !file_path.is_file() {
         anyhow::bail!("File not found: {}", file_path.display());
     }
 
@@ -721,12 +717,16 @@ async fn check(
 
     if extraction.references.is_empty() {
         writeln!(writer, "No references to check.")?;
+        writer.flush()?;
         return Ok(());
     }
 
+    // Flush the buffered summary before progress lines start interleaving
+    writer.flush()?;
+
     // Set up progress callback
     let progress_writer: Arc<Mutex<Box<dyn Write + Send>>> = if output.is_some() {
-        Arc::new(Mutex::new(Box::new(std::io::stderr())))
+        Arc::new(Mutex::new(Box::new(LineWriter::new(std::io::stderr()))))
     } else {
         Arc::new(Mutex::new(Box::new(std::io::stdout())))
     };
@@ -777,6 +777,7 @@ async fn check(
     output::print_doi_issues(&mut writer, &results, color)?;
     output::print_retraction_warnings(&mut writer, &results, color)?;
     output::print_summary(&mut writer, &results, &skip_stats, color)?;
+    writer.flush()?;
 
     // --json export
     if let Some(json_path) = json_output {
@@ -813,11 +814,7 @@ async fn run_archive_check(
 ) -> anyhow::Result<()> {
     use hallucinator_ingest::archive::{ArchiveItem, extract_archive_streaming};
 
-    let mut writer: Box<dyn Write> = if let Some(ref output_path) = output {
-        Box::new(std::fs::File::create(output_path)?)
-    } else {
-        Box::new(std::io::stdout())
-    };
+    let mut writer = open_report_writer(output.as_deref())?;
 
     let archive_name = archive_path
         .file_name()
@@ -847,31 +844,84 @@ async fn run_archive_check(
     }
     let mut json_data: Vec<PerFileData> = Vec::new();
 
-    for item in rx {
+    // Archive items whose reference extraction runs on a blocking thread, so
+    // parsing upcoming files (CPU-bound) overlaps with checking the current
+    // one (network-bound). Reports are still printed in archive order.
+    enum Pending {
+        Warning(String),
+        Pdf {
+            filename: String,
+            extraction: tokio::task::JoinHandle<
+                Result<hallucinator_ingest::ExtractionResult, hallucinator_ingest::IngestError>,
+            >,
+        },
+        Done {
+            total: usize,
+        },
+    }
+    let start = |item: ArchiveItem| match item {
+        ArchiveItem::Warning(msg) => Pending::Warning(msg),
+        ArchiveItem::Pdf(extracted) => Pending::Pdf {
+            filename: extracted.filename,
+            extraction: tokio::task::spawn_blocking(move || {
+                hallucinator_ingest::extract_references(&extracted.path)
+            }),
+        },
+        ArchiveItem::Done { total } => Pending::Done { total },
+    };
+    let lookahead = std::thread::available_parallelism().map_or(4, |n| n.get());
+    let mut queue: std::collections::VecDeque<Pending> = std::collections::VecDeque::new();
+
+    loop {
+        // Block only when nothing is queued; otherwise top up with whatever
+        // the archive thread has already produced.
+        if queue.is_empty() {
+            match rx.recv() {
+                Ok(item) => queue.push_back(start(item)),
+                Err(_) => break,
+            }
+        }
+        while queue.len() < lookahead {
+            match rx.try_recv() {
+                Ok(item) => queue.push_back(start(item)),
+                Err(_) => break,
+            }
+        }
+        let Some(item) = queue.pop_front() else {
+            break;
+        };
+
         match item {
-            ArchiveItem::Warning(msg) => {
+            Pending::Warning(msg) => {
                 writeln!(writer, "Warning: {}", msg)?;
             }
-            ArchiveItem::Pdf(extracted) => {
+            Pending::Pdf {
+                filename,
+                extraction,
+            } => {
                 file_count += 1;
 
                 // Print a header separator for each file
-                writeln!(writer, "─── {} ───", extracted.filename)?;
+                writeln!(writer, "─── {} ───", filename)?;
                 writeln!(writer)?;
 
-                let path = extracted.path.clone();
-                let extraction = match hallucinator_ingest::extract_references(&path) {
-                    Ok(e) => e,
-                    Err(e) => {
+                let extraction = match extraction.await {
+                    Ok(Ok(e)) => e,
+                    Ok(Err(e)) => {
                         writeln!(writer, "  Error: {}", e)?;
                         writeln!(writer)?;
                         continue;
                     }
+                    Err(e) => {
+                        writeln!(writer, "  Error: extraction task failed: {}", e)?;
+                        writeln!(writer)?;
+                        continue;
+                    }
                 };
 
                 output::print_extraction_summary(
                     &mut writer,
-                    &extracted.filename,
+                    &filename,
                     extraction.references.len(),
                     &extraction.skip_stats,
                     color,
@@ -882,9 +932,10 @@ async fn run_archive_check(
                     writeln!(writer)?;
                     continue;
                 }
+                writer.flush()?;
 
                 let progress_writer: Arc<Mutex<Box<dyn Write + Send>>> = if output.is_some() {
-                    Arc::new(Mutex::new(Box::new(std::io::stderr())))
+                    Arc::new(Mutex::new(Box::new(LineWriter::new(std::io::stderr()))))
                 } else {
                     Arc::new(Mutex::new(Box::new(std::io::stdout())))
                 };
@@ -939,20 +990,21 @@ async fn run_archive_check(
                 output::print_retraction_warnings(&mut writer, &results, color)?;
                 output::print_summary(&mut writer, &results, &skip_stats, color)?;
                 writeln!(writer)?;
+                writer.flush()?;
 
                 // Accumulate for --json export
                 if json_output.is_some() {
                     let (_, report_refs, results_vec, stats) =
-                        build_report_data(&extracted.filename, &results, &ref_meta, &skip_stats);
+                        build_report_data(&filename, &results, &ref_meta, &skip_stats);
                     json_data.push(PerFileData {
-                        filename: extracted.filename.clone(),
+                        filename,
                         report_refs,
                         results_vec,
                         stats,
                     });
                 }
             }
-            ArchiveItem::Done { total } => {
+            Pending::Done { total } => {
                 writeln!(writer, "Processed {} file(s) from archive.", total)?;
             }
         }
@@ -966,6 +1018,7 @@ async fn run_archive_check(
     if file_count == 0 {
         writeln!(writer, "No processable files found in archive.")?;
     }
+    writer.flush()?;
 
     // --json export for archive
     if let Some(json_path) = json_output {
@@ -994,6 +1047,18 @@ async fn run_archive_check(
     Ok(())
 }
 
+/// Open the report writer: the `--output` file if given, otherwise stdout.
+///
+/// The writer is buffered so reports go out in large writes instead of one
+/// syscall per line. Callers flush it before progress output starts and once
+/// the report is complete.
+fn open_report_writer(output: Option<&std::path::Path>) -> std::io::Result<Box<dyn Write>> {
+    Ok(match output {
+        Some(path) => Box::new(BufWriter::new(std::fs::File::create(path)?)),
+        None => Box::new(BufWriter::new(std::io::stdout())),
+    })
+}
+
 async fn dry_run_check(
     file_path: PathBuf,
     no_color: bool,
@@ -1001,13 +1066,9 @@ async fn dry_run_check(
 ) -> anyhow::Result<()> {
     let use_color = !no_color && output.is_none();
 
-    let mut writer: Box<dyn Write> = if let Some(ref output_path) = output {
-        Box::new(std::fs::File::create(output_path)?)
-    } else {
-        Box::new(std::io::stdout())
-    };
+    let mut writer = open_report_writer(output.as_deref())?;
 
-    if !file_path.exists() {
+    if !file_path.is_file() {
         anyhow::bail!("File not found: {}", file_path.display());
     }
 
@@ -1026,10 +1087,12 @@ async fn dry_run_check(
         .unwrap_or(false);
 
     if is_bbl || is_bib {
-        dry_run_bbl(&file_path, &file_name, use_color, &mut writer)
+        dry_run_bbl(&file_path, &file_name, use_color, &mut writer)?;
     } else {
-        dry_run_pdf(&file_path, &file_name, use_color, &mut writer)
+        dry_run_pdf(&file_path, &file_name, use_color, &mut writer)?;
     }
+    writer.flush()?;
+    Ok(())
 }
 
 fn dry_run_pdf(
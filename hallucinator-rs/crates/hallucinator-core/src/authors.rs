@@ -48,31 +48,20 @@ pub fn validate_authors(ref_authors: &[String], found_authors: &[String]) -> boo
             })
             .collect();
 
-        let found_surnames: Vec<String> = found_authors
-            .iter()
-            .filter_map(|a| {
-                let s = get_last_name(a);
-                if s.is_empty() { None } else { Some(s) }
-            })
-            .collect();
-
-        for rn in &ref_surnames {
-            for fn_ in &found_surnames {
-                if rn == fn_ {
-                    return true;
-                }
-                // Check if one surname ends with the other
-                if fn_.ends_with(rn.as_str()) || rn.ends_with(fn_.as_str()) {
-                    return true;
-                }
-            }
-        }
-        false
+        // Normalize found authors lazily and stop at the first overlap
+        found_authors.iter().any(|a| {
+            let fn_ = get_last_name(a);
+            !fn_.is_empty()
+                && ref_surnames.iter().any(|rn| {
+                    // Exact match, or one surname ends with the other
+                    rn == &fn_ || fn_.ends_with(rn.as_str()) || rn.ends_with(fn_.as_str())
+                })
+        })
     } else {
         let ref_set: HashSet<String> = ref_authors.iter().map(|a| normalize_author(a)).collect();
-        let found_set: HashSet<String> =
-            found_authors.iter().map(|a| normalize_author(a)).collect();
-        !ref_set.is_disjoint(&found_set)
+        found_authors
+            .iter()
+            .any(|a| ref_set.contains(&normalize_author(a)))
     }
 }
 
@@ -30,6 +30,16 @@ pub const DEFAULT_POSITIVE_TTL: Duration = Duration::from_secs(7 * 24 * 60 * 60)
 /// Default time-to-live for negative (not found) cache entries: 24 hours.
 pub const DEFAULT_NEGATIVE_TTL: Duration = Duration::from_secs(24 * 60 * 60);
 
+/// On-disk format version, stored in SQLite's `user_version` pragma.
+///
+/// Bump this when the meaning of stored rows changes (not for additive column
+/// migrations); databases written with a different version are wiped on open.
+/// That includes *newer* versions: opening a cache with an older binary
+/// discards results written by a newer one, since their rows can't be trusted
+/// to mean the same thing. Version 0 is a database from before versioning and
+/// is migrated in place.
+const SCHEMA_VERSION: i32 = 1;
+
 /// Cache key: normalized title + database name.
 #[derive(Hash, Eq, PartialEq, Clone, Debug)]
 struct CacheKey {
@@ -88,6 +98,15 @@ struct SqliteWriter {
 impl SqliteWriter {
     fn open(path: &Path) -> Result<Self, rusqlite::Error> {
         let conn = open_sqlite(path, false)?;
+        let version: i32 = conn.query_row("PRAGMA user_version", [], |row| row.get(0))?;
+        if version != 0 && version != SCHEMA_VERSION {
+            tracing::info!(
+                "Cache schema version {} != {}, discarding cached results",
+                version,
+                SCHEMA_VERSION
+            );
+            conn.execute_batch("DROP TABLE IF EXISTS query_cache")?;
+        }
         conn.execute_batch(
             "CREATE TABLE IF NOT EXISTS query_cache (
                  normalized_title TEXT NOT NULL,
@@ -111,6 +130,7 @@ impl SqliteWriter {
                  fp_reason        TEXT NOT NULL
              );",
         )?;
+        conn.pragma_update(None, "user_version", SCHEMA_VERSION)?;
         Ok(Self { conn })
     }
 
@@ -338,12 +358,12 @@ impl ReadPool {
 
         let (found, found_title, authors_json, paper_url, inserted_at, retraction_json) = row;
 
+        // A found row whose authors don't parse is malformed: treat it as a
+        // miss so the DB is queried again and the row overwritten.
         let result = if found != 0 {
             CachedResult::Found {
                 title: found_title.unwrap_or_default(),
-                authors: authors_json
-                    .and_then(|j| serde_json::from_str(&j).ok())
-                    .unwrap_or_default(),
+                authors: serde_json::from_str(authors_json.as_deref()?).ok()?,
                 url: paper_url,
                 retraction: retraction_json.and_then(|j| serde_json::from_str(&j).ok()),
             }
@@ -995,6 +1015,38 @@ mod tests {
         let _ = std::fs::remove_file(&path);
     }
 
+    #[test]
+    fn sqlite_schema_version_mismatch_discards_results() {
+        let path = temp_cache_path();
+        let _ = std::fs::remove_file(&path);
+
+        let cache = QueryCache::open(&path, DEFAULT_POSITIVE_TTL, DEFAULT_NEGATIVE_TTL).unwrap();
+        cache.insert(
+            "Deep Learning",
+            "CrossRef",
+            &DbQueryResult::found("Deep Learning", vec!["LeCun".into()], None),
+        );
+        cache.set_fp_override("Deep Learning", Some("known good"));
+        drop(cache);
+
+        // Simulate a database written by a different format version
+        let conn = Connection::open(&path).unwrap();
+        conn.pragma_update(None, "user_version", SCHEMA_VERSION + 1)
+            .unwrap();
+        drop(conn);
+
+        let cache = QueryCache::open(&path, DEFAULT_POSITIVE_TTL, DEFAULT_NEGATIVE_TTL).unwrap();
+        assert_eq!(cache.disk_len(), 0);
+        assert!(cache.get("Deep Learning", "CrossRef").is_none());
+        // User FP overrides are not cached results and survive
+        assert_eq!(
+            cache.get_fp_override("Deep Learning").as_deref(),
+            Some("known good")
+        );
+
+        let _ = std::fs::remove_file(&path);
+    }
+
     #[test]
     fn sqlite_clear() {
         let path = temp_cache_path();
@@ -1183,13 +1235,9 @@ mod tests {
             .unwrap();
         }
 
-        // Re-open and read — should fall back to empty authors, not panic
+        // Re-open and read — should be a miss (so the DB is re-queried), not panic
         let cache2 = QueryCache::open(&path, DEFAULT_POSITIVE_TTL, DEFAULT_NEGATIVE_TTL).unwrap();
-        let cached = cache2.get("Test Paper", "DB");
-        assert!(cached.is_some());
-        let r = cached.unwrap();
-        assert_eq!(r.found_title.unwrap(), "Test Paper");
-        assert!(r.authors.is_empty()); // corrupted JSON → empty fallback
+        assert!(cache2.get("Test Paper", "DB").is_none());
 
         let _ = std::fs::remove_file(&path);
     }
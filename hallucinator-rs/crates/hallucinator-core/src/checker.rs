@@ -1,23 +1,56 @@
 use crate::db::DatabaseBackend;
 use crate::db::DbQueryResult;
+use crate::db::crossref::{self, CrossRef};
 use crate::db::searxng::Searxng;
+use crate::db::semantic_scholar::{self, SemanticScholar};
 use crate::doi::{DoiMatchResult, DoiValidation, check_doi_match, validate_doi};
-use crate::orchestrator::query_all_databases;
-use crate::pool::{RefJob, ValidationPool};
+use crate::matching::{TitleMatcher, normalize_title};
+use crate::orchestrator::{build_database_list, query_all_databases};
+use crate::pool::{RefJob, ValidationPool, http_client};
+use crate::rate_limit::DbQueryError;
 use crate::retraction::check_retraction;
 use crate::{
-    Config, DbResult, DbStatus, DoiInfo, ProgressEvent, Reference, RetractionInfo, Status,
-    ValidationResult,
+    Config, DbResult, DbStatus, DoiInfo, ProgressEvent, QueryCache, Reference, RetractionInfo,
+    Status, ValidationResult,
 };
+use serde_json::Value;
+use std::collections::HashMap;
+use std::future::Future;
 use std::sync::Arc;
 use std::time::Duration;
+use tokio::sync::watch;
 use tokio_util::sync::CancellationToken;
 
+/// Key identifying references that would produce identical validation results:
+/// same normalized title, authors, DOI and arXiv ID.
+type DedupKey = (String, Vec<String>, Option<String>, Option<String>);
+
+fn dedup_key(reference: &Reference) -> Option<DedupKey> {
+    let title = normalize_title(reference.title.as_deref()?);
+    if title.is_empty() {
+        return None;
+    }
+    Some((
+        title,
+        reference.authors.clone(),
+        reference.doi.clone(),
+        reference.arxiv_id.clone(),
+    ))
+}
+
+/// Upper bound on each DB's DOI batch prefetch. Past it, that DB's drainer
+/// falls back to per-title queries for whatever is not cached yet.
+const PREFETCH_TIMEOUT: Duration = Duration::from_secs(30);
+
 /// Check a list of references against academic databases.
 ///
 /// Creates an internal ValidationPool with `num_workers` workers.
 /// Submits all refs, collects results via oneshot channels.
 /// Progress events are emitted via the callback. Cancellation is supported.
+///
+/// References that repeat an earlier one (same normalized title, authors, DOI
+/// and arXiv ID) are not re-queried: the first occurrence's result is copied
+/// to each duplicate, and Checking/Result events are still emitted for it.
 pub async fn check_references(
     refs: Vec<Reference>,
     config: Config,
@@ -33,40 +66,275 @@ pub async fn check_references(
     let config = Arc::new(config);
     let progress = Arc::new(progress);
 
-    // Create the pool
-    let pool = ValidationPool::new(config.clone(), cancel.clone(), num_workers);
+    // Create the pool right away; only the prefetched DBs' drainers wait,
+    // each for its own DOI batches to land in the cache
+    let client = http_client();
+    let (crossref_ready, crossref_gate) = watch::channel(false);
+    let (s2_ready, s2_gate) = watch::channel(false);
+    let gates = HashMap::from([
+        ("CrossRef".to_string(), crossref_gate),
+        ("Semantic Scholar".to_string(), s2_gate),
+    ]);
+    let pool = ValidationPool::with_gates(
+        config.clone(),
+        cancel.clone(),
+        num_workers,
+        client.clone(),
+        gates,
+    );
+
+    let prefetch = prefetch_doi_batches(&refs, &config, &client, &cancel, crossref_ready, s2_ready);
+
+    let validate = async {
+        // Submit the first occurrence of each ref and collect oneshot receivers;
+        // later occurrences are recorded under their first index
+        let mut first_seen: HashMap<DedupKey, usize> = HashMap::new();
+        let mut duplicates: HashMap<usize, Vec<usize>> = HashMap::new();
+        let mut receivers = Vec::with_capacity(total);
+        for (i, reference) in refs.iter().enumerate() {
+            if cancel.is_cancelled() {
+                break;
+            }
+
+            if let Some(key) = dedup_key(reference) {
+                if let Some(&first) = first_seen.get(&key) {
+                    duplicates.entry(first).or_default().push(i);
+                    continue;
+                }
+                first_seen.insert(key, i);
+            }
+
+            let (result_tx, result_rx) = tokio::sync::oneshot::channel();
+            let job = RefJob {
+                reference: reference.clone(),
+                result_tx,
+                ref_index: i,
+                total,
+                progress: progress.clone(),
+            };
+
+            pool.submit(job).await;
+            receivers.push((i, result_rx));
+        }
+
+        // Collect results, copying each first occurrence's result to its
+        // duplicates as soon as it arrives
+        let mut results: Vec<Option<ValidationResult>> = vec![None; total];
+        for (first, rx) in receivers {
+            let Ok(result) = rx.await else {
+                continue;
+            };
+            for i in duplicates.remove(&first).unwrap_or_default() {
+                let reference = &refs[i];
+                let mut dup = result.clone();
+                dup.title = reference.title.clone().unwrap_or_default();
+                dup.raw_citation = reference.raw_citation.clone();
+
+                progress(ProgressEvent::Checking {
+                    index: i,
+                    total,
+                    title: dup.title.clone(),
+                });
+                progress(ProgressEvent::Result {
+                    index: i,
+                    total,
+                    result: Box::new(dup.clone()),
+                });
+                results[i] = Some(dup);
+            }
+            results[first] = Some(result);
+        }
+        results
+    };
+    let ((), results) = tokio::join!(prefetch, validate);
+
+    pool.shutdown().await;
 
-    // Submit all refs and collect oneshot receivers
-    let mut receivers = Vec::with_capacity(total);
-    for (i, reference) in refs.iter().enumerate() {
-        if cancel.is_cancelled() {
-            break;
+    results.into_iter().flatten().collect()
+}
+
+/// Warm the query cache with batched DOI lookups while the pool starts.
+///
+/// CrossRef and Semantic Scholar are prefetched independently. Each opens its
+/// drainer's gate (`crossref_ready` / `s2_ready`) as soon as its own batches
+/// are done, time out or are cancelled; neither waits for the other.
+///
+/// Instead of one title search per reference, references that carry a DOI
+/// are looked up in batches: CrossRef with `filter=doi:` (one request per
+/// ~2000-char URL) and Semantic Scholar with `paper/batch` (up to
+/// [`semantic_scholar::MAX_BATCH_SIZE`] IDs per request). Each paper whose
+/// title matches its reference is cached as that reference's result for the
+/// DB, so the drainer gets a cache hit. Everything else (no match, no DOI,
+/// failed batch) falls through to the normal per-title query.
+///
+/// Does nothing without a query cache. Disabled DBs are skipped.
+async fn prefetch_doi_batches(
+    refs: &[Reference],
+    config: &Config,
+    client: &reqwest::Client,
+    cancel: &CancellationToken,
+    crossref_ready: watch::Sender<bool>,
+    s2_ready: watch::Sender<bool>,
+) {
+    let Some(cache) = config.query_cache.as_deref() else {
+        return;
+    };
+    let enabled: Vec<String> = build_database_list(config, None)
+        .iter()
+        .map(|db| db.name().to_string())
+        .collect();
+    let is_enabled = |name: &str| enabled.iter().any(|db| db == name);
+
+    let crossref = async {
+        if is_enabled("CrossRef") {
+            bounded_prefetch(prefetch_crossref(refs, config, cache, client), cancel).await;
         }
+        let _ = crossref_ready.send(true);
+    };
+    let s2 = async {
+        if is_enabled("Semantic Scholar") {
+            bounded_prefetch(
+                prefetch_semantic_scholar(refs, config, cache, client),
+                cancel,
+            )
+            .await;
+        }
+        let _ = s2_ready.send(true);
+    };
+    tokio::join!(crossref, s2);
+}
 
-        let (result_tx, result_rx) = tokio::sync::oneshot::channel();
-        let job = RefJob {
-            reference: reference.clone(),
-            result_tx,
-            ref_index: i,
-            total,
-            progress: progress.clone(),
+/// Run `prefetch` until it finishes, [`PREFETCH_TIMEOUT`] elapses or the run
+/// is cancelled.
+async fn bounded_prefetch(prefetch: impl Future<Output = ()>, cancel: &CancellationToken) {
+    tokio::select! {
+        biased;
+        _ = cancel.cancelled() => {}
+        _ = tokio::time::timeout(PREFETCH_TIMEOUT, prefetch) => {}
+    }
+}
+
+/// Titles of refs not yet cached for `db_name`, keyed by lowercased DOI.
+fn uncached_titles_by_doi<'a>(
+    refs: &'a [Reference],
+    cache: &QueryCache,
+    db_name: &str,
+) -> HashMap<String, Vec<&'a str>> {
+    let mut titles_by_doi: HashMap<String, Vec<&str>> = HashMap::new();
+    for reference in refs {
+        let (Some(title), Some(doi)) = (reference.title.as_deref(), reference.doi.as_deref())
+        else {
+            continue;
         };
+        if title.is_empty() || cache.get(title, db_name).is_some() {
+            continue;
+        }
+        titles_by_doi
+            .entry(doi.to_lowercase())
+            .or_default()
+            .push(title);
+    }
+    titles_by_doi
+}
 
-        pool.submit(job).await;
-        receivers.push((i, result_rx));
+/// Wait for the DB's rate limiter and run one batch request.
+///
+/// Failures are logged and yield `None`; a 429 also backs off the limiter.
+async fn rate_limited_batch<F>(config: &Config, db_name: &str, request: F) -> Option<Vec<Value>>
+where
+    F: Future<Output = Result<Vec<Value>, DbQueryError>>,
+{
+    let limiter = config.rate_limiters.get(db_name);
+    if let Some(lim) = limiter {
+        lim.acquire().await;
+    }
+    match request.await {
+        Ok(items) => Some(items),
+        Err(e) => {
+            tracing::debug!(db = db_name, error = ?e, "DOI batch failed");
+            if matches!(e, DbQueryError::RateLimited { .. })
+                && let Some(lim) = limiter
+            {
+                lim.on_rate_limited();
+            }
+            None
+        }
+    }
+}
+
+async fn prefetch_crossref(
+    refs: &[Reference],
+    config: &Config,
+    cache: &QueryCache,
+    client: &reqwest::Client,
+) {
+    let titles_by_doi = uncached_titles_by_doi(refs, cache, "CrossRef");
+    if titles_by_doi.is_empty() {
+        return;
     }
 
-    // Collect results
-    let mut results: Vec<Option<ValidationResult>> = vec![None; total];
-    for (i, rx) in receivers {
-        if let Ok(result) = rx.await {
-            results[i] = Some(result);
+    let backend = CrossRef {
+        mailto: config.crossref_mailto.clone(),
+    };
+    let timeout = Duration::from_secs(config.db_timeout_secs);
+
+    let dois: Vec<&str> = titles_by_doi.keys().map(String::as_str).collect();
+    for batch in crossref::doi_batches(&dois) {
+        let request = backend.query_doi_batch(&batch, client, timeout);
+        let Some(items) = rate_limited_batch(config, "CrossRef", request).await else {
+            continue;
+        };
+
+        for item in &items {
+            let Some(doi) = item["DOI"].as_str() else {
+                continue;
+            };
+            let Some(titles) = titles_by_doi.get(&doi.to_lowercase()) else {
+                continue;
+            };
+            for title in titles {
+                if let Some(result) = crossref::match_item(item, &TitleMatcher::new(title)) {
+                    cache.insert(title, "CrossRef", &result);
+                }
+            }
         }
     }
+}
 
-    pool.shutdown().await;
+async fn prefetch_semantic_scholar(
+    refs: &[Reference],
+    config: &Config,
+    cache: &QueryCache,
+    client: &reqwest::Client,
+) {
+    let titles_by_doi = uncached_titles_by_doi(refs, cache, "Semantic Scholar");
+    if titles_by_doi.is_empty() {
+        return;
+    }
 
-    results.into_iter().flatten().collect()
+    let backend = SemanticScholar {
+        api_key: config.s2_api_key.clone(),
+    };
+    let timeout = Duration::from_secs(config.db_timeout_secs);
+
+    let dois: Vec<&String> = titles_by_doi.keys().collect();
+    for batch in dois.chunks(semantic_scholar::MAX_BATCH_SIZE) {
+        let ids: Vec<String> = batch.iter().map(|doi| format!("DOI:{doi}")).collect();
+        let request = backend.query_id_batch(&ids, client, timeout);
+        let Some(items) = rate_limited_batch(config, "Semantic Scholar", request).await else {
+            continue;
+        };
+
+        // The response is positional, with null for unknown IDs
+        for (doi, item) in batch.iter().zip(&items) {
+            for title in &titles_by_doi[*doi] {
+                if let Some(result) = semantic_scholar::match_item(item, &TitleMatcher::new(title))
+                {
+                    cache.insert(title, "Semantic Scholar", &result);
+                }
+            }
+        }
+    }
 }
 
 /// Check a single reference against all databases.
@@ -1,5 +1,5 @@
 use super::{DatabaseBackend, DbQueryError, DbQueryResult};
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use crate::rate_limit::check_rate_limit_response;
 use std::future::Future;
 use std::pin::Pin;
@@ -103,10 +103,11 @@ fn parse_acl_results(html: &str, title: &str) -> Result<DbQueryResult, DbQueryEr
     let author_sel = scraper::Selector::parse("span.badge.badge-light").unwrap();
     let link_sel = scraper::Selector::parse("a[href*='/papers/']").unwrap();
 
+    let matcher = TitleMatcher::new(title);
     for entry in document.select(&entry_sel) {
         if let Some(title_el) = entry.select(&title_sel).next() {
             let found_title: String = title_el.text().collect();
-            if titles_match(title, &found_title) {
+            if matcher.matches(&found_title) {
                 let authors: Vec<String> = entry
                     .select(&author_sel)
                     .map(|a| a.text().collect::<String>().trim().to_string())
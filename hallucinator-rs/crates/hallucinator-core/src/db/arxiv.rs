@@ -1,5 +1,5 @@
 use super::{DatabaseBackend, DbQueryError, DbQueryResult};
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use crate::text_utils::get_query_words;
 use std::future::Future;
 use std::pin::Pin;
@@ -65,6 +65,7 @@ fn parse_arxiv_response(xml: &str, title: &str) -> Result<DbQueryResult, DbQuery
     let mut current_name = String::new();
     let mut current_link = String::new();
 
+    let matcher = TitleMatcher::new(title);
     let mut buf = Vec::new();
 
     loop {
@@ -125,7 +126,7 @@ fn parse_arxiv_response(xml: &str, title: &str) -> Result<DbQueryResult, DbQuery
                     b"entry" => {
                         // Check if this entry matches
                         let entry_title = current_title.trim().to_string();
-                        if titles_match(title, &entry_title) {
+                        if matcher.matches(&entry_title) {
                             // Skip results with empty authors - let other DBs verify
                             if !current_authors.is_empty() {
                                 let link = if current_link.is_empty() {
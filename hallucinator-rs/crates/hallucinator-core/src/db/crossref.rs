@@ -1,5 +1,5 @@
 use super::{DatabaseBackend, DbQueryError, DbQueryResult};
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use crate::rate_limit::check_rate_limit_response;
 use crate::retraction::extract_retraction_from_item;
 use crate::text_utils::get_query_words;
@@ -7,10 +7,158 @@ use std::future::Future;
 use std::pin::Pin;
 use std::time::Duration;
 
+/// Longest `filter=doi:...` URL sent in one batched DOI lookup.
+/// CrossRef answers HTTP 414 for much longer request lines.
+const MAX_DOI_BATCH_URL_LEN: usize = 2000;
+
 pub struct CrossRef {
     pub mailto: Option<String>,
 }
 
+impl CrossRef {
+    /// Append `mailto` to `url` (if configured) and return the User-Agent to send.
+    fn polite_user_agent(&self, url: &mut String) -> String {
+        if let Some(ref email) = self.mailto {
+            url.push_str(&format!("&mailto={}", urlencoding::encode(email)));
+            format!("HallucinatedReferenceChecker/1.0 (mailto:{})", email)
+        } else {
+            "Academic Reference Parser".to_string()
+        }
+    }
+
+    /// Fetch `url` and return the `message.items` array of the response.
+    async fn fetch_items(
+        &self,
+        mut url: String,
+        client: &reqwest::Client,
+        timeout: Duration,
+    ) -> Result<Vec<serde_json::Value>, DbQueryError> {
+        let user_agent = self.polite_user_agent(&mut url);
+
+        let resp = client
+            .get(&url)
+            .header("User-Agent", user_agent)
+            .timeout(timeout)
+            .send()
+            .await
+            .map_err(|e| DbQueryError::Other(e.to_string()))?;
+
+        check_rate_limit_response(&resp)?;
+        if !resp.status().is_success() {
+            return Err(DbQueryError::Other(format!("HTTP {}", resp.status())));
+        }
+
+        let mut data: serde_json::Value = resp
+            .json()
+            .await
+            .map_err(|e| DbQueryError::Other(e.to_string()))?;
+        Ok(match data["message"]["items"].take() {
+            serde_json::Value::Array(items) => items,
+            _ => vec![],
+        })
+    }
+
+    /// Look up one batch of DOIs with a single `filter=doi:` request.
+    ///
+    /// Returns the CrossRef works found; DOIs CrossRef doesn't know are simply
+    /// absent. Use [`doi_batches`] to split a DOI list into batches whose URL
+    /// stays short enough.
+    pub async fn query_doi_batch(
+        &self,
+        dois: &[&str],
+        client: &reqwest::Client,
+        timeout: Duration,
+    ) -> Result<Vec<serde_json::Value>, DbQueryError> {
+        if dois.is_empty() {
+            return Ok(vec![]);
+        }
+        let url = format!(
+            "https://api.crossref.org/works?filter={}&rows={}",
+            doi_filter(dois),
+            dois.len()
+        );
+        self.fetch_items(url, client, timeout).await
+    }
+}
+
+/// `doi:a,doi:b,...`, URL-encoded.
+fn doi_filter(dois: &[&str]) -> String {
+    dois.iter()
+        .map(|d| format!("doi:{}", urlencoding::encode(d)))
+        .collect::<Vec<_>>()
+        .join(",")
+}
+
+/// Split `dois` into batches whose `filter=doi:` URL fits in [`MAX_DOI_BATCH_URL_LEN`].
+pub fn doi_batches<'a>(dois: &[&'a str]) -> Vec<Vec<&'a str>> {
+    // Room for the endpoint, `rows`, and a `mailto` parameter.
+    const BASE_LEN: usize = 200;
+
+    let mut batches: Vec<Vec<&str>> = Vec::new();
+    let mut current: Vec<&str> = Vec::new();
+    let mut len = BASE_LEN;
+    for &doi in dois {
+        let entry_len = "doi:".len() + urlencoding::encode(doi).len() + 1;
+        if !current.is_empty() && len + entry_len > MAX_DOI_BATCH_URL_LEN {
+            batches.push(std::mem::take(&mut current));
+            len = BASE_LEN;
+        }
+        current.push(doi);
+        len += entry_len;
+    }
+    if !current.is_empty() {
+        batches.push(current);
+    }
+    batches
+}
+
+/// Turn a CrossRef work into a found result if its title matches `title`.
+///
+/// Works without author data are rejected so other DBs get to verify
+/// (issue #188): CrossRef sometimes returns title matches without authors,
+/// which causes false AuthorMismatch when we can't verify authors.
+pub(crate) fn match_item(item: &serde_json::Value, title: &TitleMatcher) -> Option<DbQueryResult> {
+    let found_title = item["title"]
+        .as_array()
+        .and_then(|a| a.first())
+        .and_then(|v| v.as_str())
+        .unwrap_or("");
+
+    if !title.matches(found_title) {
+        return None;
+    }
+
+    let authors: Vec<String> = item["author"]
+        .as_array()
+        .map(|arr| {
+            arr.iter()
+                .map(|a| {
+                    let given = a["given"].as_str().unwrap_or("");
+                    let family = a["family"].as_str().unwrap_or("");
+                    format!("{} {}", given, family).trim().to_string()
+                })
+                .collect()
+        })
+        .unwrap_or_default();
+
+    if authors.is_empty() {
+        return None;
+    }
+
+    let doi = item["DOI"].as_str();
+    let paper_url = doi.map(|d| format!("https://doi.org/{}", d));
+
+    // Extract retraction info inline from the same CrossRef response
+    let retraction = extract_retraction_from_item(item);
+
+    Some(DbQueryResult {
+        found_title: Some(found_title.to_string()),
+        authors,
+        paper_url,
+        retraction: Some(retraction),
+    })
+}
+
 impl DatabaseBackend for CrossRef {
     fn name(&self) -> &str {
         "CrossRef"
@@ -25,84 +173,74 @@ impl DatabaseBackend for CrossRef {
         Box::pin(async move {
             let words = get_query_words(title, 6);
             let query = words.join(" ");
-            let mut url = format!(
+            let url = format!(
                 "https://api.crossref.org/works?query.title={}&rows=5",
                 urlencoding::encode(&query)
             );
 
-            let user_agent = if let Some(ref email) = self.mailto {
-                url.push_str(&format!("&mailto={}", urlencoding::encode(email)));
-                format!("HallucinatedReferenceChecker/1.0 (mailto:{})", email)
-            } else {
-                "Academic Reference Parser".to_string()
-            };
-
-            let resp = client
-                .get(&url)
-                .header("User-Agent", user_agent)
-                .timeout(timeout)
-                .send()
-                .await
-                .map_err(|e| DbQueryError::Other(e.to_string()))?;
-
-            check_rate_limit_response(&resp)?;
-            if !resp.status().is_success() {
-                return Err(DbQueryError::Other(format!("HTTP {}", resp.status())));
-            }
-
-            let data: serde_json::Value = resp
-                .json()
-                .await
-                .map_err(|e| DbQueryError::Other(e.to_string()))?;
-            let items = data["message"]["items"]
-                .as_array()
-                .cloned()
-                .unwrap_or_default();
-
-            for item in items {
-                let found_title = item["title"]
-                    .as_array()
-                    .and_then(|a| a.first())
-                    .and_then(|v| v.as_str())
-                    .unwrap_or("");
-
-                if titles_match(title, found_title) {
-                    let authors: Vec<String> = item["author"]
-                        .as_array()
-                        .map(|arr| {
-                            arr.iter()
-                                .map(|a| {
-                                    let given = a["given"].as_str().unwrap_or("");
-                                    let family = a["family"].as_str().unwrap_or("");
-                                    format!("{} {}", given, family).trim().to_string()
-                                })
-                                .collect()
-                        })
-                        .unwrap_or_default();
-
-                    // Skip results with empty authors - let other DBs verify (issue #188)
-                    // CrossRef sometimes returns title matches without author data, which
-                    // causes false AuthorMismatch when we can't verify authors
-                    if authors.is_empty() {
-                        continue;
-                    }
-
-                    let doi = item["DOI"].as_str();
-                    let paper_url = doi.map(|d| format!("https://doi.org/{}", d));
-
-                    // Extract retraction info inline from the same CrossRef response
-                    let retraction = extract_retraction_from_item(&item);
-
-                    return Ok(DbQueryResult {
-                        found_title: Some(found_title.to_string()),
-                        authors,
-                        paper_url,
-                        retraction: Some(retraction),
-                    });
-                }
-            }
-
-            Ok(DbQueryResult::not_found())
+            let items = self.fetch_items(url, client, timeout).await?;
+            let matcher = TitleMatcher::new(title);
+
+            Ok(items
+                .iter()
+                .find_map(|item| match_item(item, &matcher))
+                .unwrap_or_else(DbQueryResult::not_found))
         })
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_doi_batches_respect_url_budget() {
+        let dois: Vec<String> = (0..200)
+            .map(|i| format!("10.1145/3548606.{i:07}"))
+            .collect();
+        let refs: Vec<&str> = dois.iter().map(String::as_str).collect();
+
+        let batches = doi_batches(&refs);
+        assert!(batches.len() > 1);
+        assert_eq!(batches.iter().map(Vec::len).sum::<usize>(), dois.len());
+        for batch in &batches {
+            assert!(200 + doi_filter(batch).len() <= MAX_DOI_BATCH_URL_LEN);
+        }
+    }
+
+    #[test]
+    fn test_doi_batches_empty() {
+        assert!(doi_batches(&[]).is_empty());
+    }
+
+    #[test]
+    fn test_match_item_requires_authors() {
+        let item = serde_json::json!({
+            "title": ["Detecting Fake References in Academic Papers"],
+            "DOI": "10.1000/xyz",
+        });
+        assert!(
+            match_item(
+                &item,
+                &TitleMatcher::new("Detecting Fake References in Academic Papers")
+            )
+            .is_none()
+        );
+
+        let item = serde_json::json!({
+            "title": ["Detecting Fake References in Academic Papers"],
+            "author": [{"given": "Jane", "family": "Smith"}],
+            "DOI": "10.1000/xyz",
+        });
+        let found = match_item(
+            &item,
+            &TitleMatcher::new("Detecting Fake References in Academic Papers"),
+        )
+        .unwrap();
+        assert_eq!(found.authors, vec!["Jane Smith".to_string()]);
+        assert_eq!(
+            found.paper_url.as_deref(),
+            Some("https://doi.org/10.1000/xyz")
+        );
+    }
+}
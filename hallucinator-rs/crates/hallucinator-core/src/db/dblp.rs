@@ -1,5 +1,5 @@
 use super::{DatabaseBackend, DbQueryError, DbQueryResult};
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use crate::rate_limit::check_rate_limit_response;
 use crate::text_utils::get_query_words;
 use std::future::Future;
@@ -115,11 +115,12 @@ impl DatabaseBackend for DblpOnline {
                 .cloned()
                 .unwrap_or_default();
 
+            let matcher = TitleMatcher::new(title);
             for hit in hits {
                 let info = &hit["info"];
                 let found_title = info["title"].as_str().unwrap_or("");
 
-                if titles_match(title, found_title) {
+                if matcher.matches(found_title) {
                     let authors: Vec<String> = match &info["authors"]["author"] {
                         serde_json::Value::Array(arr) => arr
                             .iter()
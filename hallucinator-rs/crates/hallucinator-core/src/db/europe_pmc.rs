@@ -1,5 +1,5 @@
 use super::{DatabaseBackend, DbQueryError, DbQueryResult};
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use crate::rate_limit::check_rate_limit_response;
 use once_cell::sync::Lazy;
 use regex::Regex;
@@ -57,9 +57,10 @@ impl DatabaseBackend for EuropePmc {
                 .cloned()
                 .unwrap_or_default();
 
+            let matcher = TitleMatcher::new(title);
             for item in results {
                 let found_title = item["title"].as_str().unwrap_or("");
-                if !found_title.is_empty() && titles_match(title, found_title) {
+                if !found_title.is_empty() && matcher.matches(found_title) {
                     let author_string = item["authorString"].as_str().unwrap_or("");
                     let authors: Vec<String> = if author_string.is_empty() {
                         vec![]
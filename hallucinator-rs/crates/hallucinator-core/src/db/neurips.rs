@@ -1,5 +1,5 @@
 use super::{DatabaseBackend, DbQueryError, DbQueryResult};
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use std::future::Future;
 use std::pin::Pin;
 use std::time::Duration;
@@ -82,9 +82,10 @@ fn parse_neurips_index(html: &str, title: &str) -> Option<(String, String)> {
     let document = scraper::Html::parse_document(html);
     let selector = scraper::Selector::parse("a").unwrap();
 
+    let matcher = TitleMatcher::new(title);
     for element in document.select(&selector) {
         let link_text = element.text().collect::<String>();
-        if titles_match(title, &link_text) {
+        if matcher.matches(&link_text) {
             let href = element.value().attr("href").unwrap_or("").to_string();
             return Some((link_text.trim().to_string(), href));
         }
@@ -1,5 +1,5 @@
 use super::{DatabaseBackend, DbQueryError, DbQueryResult};
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use crate::rate_limit::check_rate_limit_response;
 use crate::text_utils::get_query_words;
 use std::future::Future;
@@ -49,9 +49,10 @@ impl DatabaseBackend for OpenAlex {
                 .map_err(|e| DbQueryError::Other(e.to_string()))?;
             let results = data["results"].as_array().cloned().unwrap_or_default();
 
+            let matcher = TitleMatcher::new(title);
             for item in results.iter().take(5) {
                 let found_title = item["title"].as_str().unwrap_or("");
-                if !found_title.is_empty() && titles_match(title, found_title) {
+                if !found_title.is_empty() && matcher.matches(found_title) {
                     let authors: Vec<String> = item["authorships"]
                         .as_array()
                         .map(|arr| {
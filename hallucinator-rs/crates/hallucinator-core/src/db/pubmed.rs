@@ -1,5 +1,5 @@
 use super::{DatabaseBackend, DbQueryError, DbQueryResult};
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use crate::rate_limit::check_rate_limit_response;
 use crate::text_utils::get_query_words;
 use std::future::Future;
@@ -89,10 +89,11 @@ impl DatabaseBackend for PubMed {
                 .map_err(|e| DbQueryError::Other(e.to_string()))?;
             let results = &data["result"];
 
+            let matcher = TitleMatcher::new(title);
             for pmid in &id_list {
                 let item = &results[pmid];
                 let found_title = item["title"].as_str().unwrap_or("");
-                if !found_title.is_empty() && titles_match(title, found_title) {
+                if !found_title.is_empty() && matcher.matches(found_title) {
                     let authors: Vec<String> = item["authors"]
                         .as_array()
                         .map(|arr| {
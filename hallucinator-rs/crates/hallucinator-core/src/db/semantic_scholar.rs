@@ -1,5 +1,5 @@
 use super::{DatabaseBackend, DbQueryError, DbQueryResult};
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use crate::rate_limit::check_rate_limit_response;
 use crate::text_utils::get_query_words;
 use std::future::Future;
@@ -53,32 +53,105 @@ impl DatabaseBackend for SemanticScholar {
                 .await
                 .map_err(|e| DbQueryError::Other(e.to_string()))?;
             let results = data["data"].as_array().cloned().unwrap_or_default();
+            let matcher = TitleMatcher::new(title);
 
-            for item in results {
-                let found_title = item["title"].as_str().unwrap_or("");
-                if !found_title.is_empty() && titles_match(title, found_title) {
-                    let authors: Vec<String> = item["authors"]
-                        .as_array()
-                        .map(|arr| {
-                            arr.iter()
-                                .filter_map(|a| a["name"].as_str().map(String::from))
-                                .collect()
-                        })
-                        .unwrap_or_default();
-
-                    // Skip results with empty authors - let other DBs verify
-                    // Semantic Scholar sometimes returns title matches without author data
-                    if authors.is_empty() {
-                        continue;
-                    }
-
-                    let paper_url = item["url"].as_str().map(String::from);
-
-                    return Ok(DbQueryResult::found(found_title, authors, paper_url));
-                }
-            }
+            Ok(results
+                .iter()
+                .find_map(|item| match_item(item, &matcher))
+                .unwrap_or_else(DbQueryResult::not_found))
+        })
+    }
+}
+
+/// Maximum number of IDs sent in one `paper/batch` request.
+pub const MAX_BATCH_SIZE: usize = 50;
+
+impl SemanticScholar {
+    /// Look up papers by ID (e.g. `DOI:10.1234/x`) with one `paper/batch` request.
+    ///
+    /// The returned vector is positional: entry `i` belongs to `ids[i]` and is
+    /// `Value::Null` when Semantic Scholar doesn't know that ID.
+    pub async fn query_id_batch(
+        &self,
+        ids: &[String],
+        client: &reqwest::Client,
+        timeout: Duration,
+    ) -> Result<Vec<serde_json::Value>, DbQueryError> {
+        let mut req = client
+            .post("https://api.semanticscholar.org/graph/v1/paper/batch?fields=title,authors,url")
+            .header("User-Agent", "Academic Reference Parser")
+            .json(&serde_json::json!({ "ids": ids }))
+            .timeout(timeout);
+
+        if let Some(ref key) = self.api_key {
+            req = req.header("x-api-key", key);
+        }
+
+        let resp = req
+            .send()
+            .await
+            .map_err(|e| DbQueryError::Other(e.to_string()))?;
 
-            Ok(DbQueryResult::not_found())
+        check_rate_limit_response(&resp)?;
+        if !resp.status().is_success() {
+            return Err(DbQueryError::Other(format!("HTTP {}", resp.status())));
+        }
+
+        let data: serde_json::Value = resp
+            .json()
+            .await
+            .map_err(|e| DbQueryError::Other(e.to_string()))?;
+        Ok(data.as_array().cloned().unwrap_or_default())
+    }
+}
+
+/// Turn a Semantic Scholar paper object into a found result if its title matches.
+pub(crate) fn match_item(item: &serde_json::Value, title: &TitleMatcher) -> Option<DbQueryResult> {
+    let found_title = item["title"].as_str().unwrap_or("");
+    if found_title.is_empty() || !title.matches(found_title) {
+        return None;
+    }
+    let authors: Vec<String> = item["authors"]
+        .as_array()
+        .map(|arr| {
+            arr.iter()
+                .filter_map(|a| a["name"].as_str().map(String::from))
+                .collect()
         })
+        .unwrap_or_default();
+
+    // Skip results with empty authors - let other DBs verify
+    // Semantic Scholar sometimes returns title matches without author data
+    if authors.is_empty() {
+        return None;
+    }
+
+    let paper_url = item["url"].as_str().map(String::from);
+    Some(DbQueryResult::found(found_title, authors, paper_url))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::json;
+
+    #[test]
+    fn test_match_item_requires_authors() {
+        let title = "Attention Is All You Need";
+        let item = json!({"title": title, "authors": [], "url": null});
+        assert!(match_item(&item, &TitleMatcher::new(title)).is_none());
+
+        let item = json!({
+            "title": title,
+            "authors": [{"name": "Ashish Vaswani"}],
+            "url": "https://www.semanticscholar.org/paper/abc"
+        });
+        let result = match_item(&item, &TitleMatcher::new(title)).unwrap();
+        assert_eq!(result.authors, vec!["Ashish Vaswani"]);
+    }
+
+    #[test]
+    fn test_match_item_null_entry() {
+        assert!(match_item(&serde_json::Value::Null, &TitleMatcher::new("Anything")).is_none());
     }
 }
@@ -1,5 +1,5 @@
 use super::{DatabaseBackend, DbQueryError, DbQueryResult};
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use crate::rate_limit::check_rate_limit_response;
 use crate::text_utils::get_query_words;
 use std::future::Future;
@@ -56,10 +56,11 @@ fn parse_ssrn_results(html: &str, title: &str) -> Result<DbQueryResult, DbQueryE
     let document = scraper::Html::parse_document(html);
     let title_sel = scraper::Selector::parse("a.title").unwrap();
 
+    let matcher = TitleMatcher::new(title);
     for link in document.select(&title_sel).take(10) {
         let found_title: String = link.text().collect();
         let found_title = found_title.trim();
-        if !found_title.is_empty() && titles_match(title, found_title) {
+        if !found_title.is_empty() && matcher.matches(found_title) {
             let href = link.value().attr("href").unwrap_or("");
             let paper_url = if href.starts_with("http") {
                 Some(href.to_string())
@@ -1,3 +1,4 @@
+use aho_corasick::AhoCorasick;
 use once_cell::sync::Lazy;
 use regex::Regex;
 use std::collections::HashMap;
@@ -92,34 +93,138 @@ static DIACRITIC_COMPOSITIONS: Lazy<HashMap<(&str, &str), &str>> = Lazy::new(||
     m
 });
 
-/// Regex: letter followed by space(s) then a diacritic mark (e.g., "B ¨")
-static SPACE_BEFORE_DIACRITIC_RE: Lazy<Regex> =
-    Lazy::new(|| Regex::new(r"([A-Za-z])\s+([\u{a8}\u{b4}`~\u{2dc}\u{2c7}\^])").unwrap());
-
-/// Regex: diacritic mark followed by optional space then a letter (e.g., "¨U")
-static SEPARATED_DIACRITIC_RE: Lazy<Regex> =
-    Lazy::new(|| Regex::new(r"([\u{a8}\u{b4}`~\u{2dc}\u{2c7}\^])\s*([A-Za-z])").unwrap());
+/// Standalone diacritic marks that PDF extraction separates from their letter.
+static DIACRITIC_MARKS: Lazy<AhoCorasick> = Lazy::new(|| {
+    AhoCorasick::new(["\u{a8}", "\u{b4}", "`", "~", "\u{2dc}", "\u{2c7}", "^"]).unwrap()
+});
 
 /// Fix separated diacritics from PDF extraction.
 ///
 /// Converts patterns like `"B ¨UNZ"` → `"BÜNZ"` and `"R´enyi"` → `"Rényi"`.
+/// Single scan over the diacritic marks; text between marks is copied as-is.
 fn fix_separated_diacritics(title: &str) -> String {
-    // Step 1: Remove space between letter and diacritic (e.g., "B ¨" -> "B¨")
-    let title = SPACE_BEFORE_DIACRITIC_RE.replace_all(title, "$1$2");
-
-    // Step 2: Compose diacritic + letter into precomposed character
-    SEPARATED_DIACRITIC_RE
-        .replace_all(&title, |caps: &regex::Captures| {
-            let diacritic = caps.get(1).unwrap().as_str();
-            let letter = caps.get(2).unwrap().as_str();
-            DIACRITIC_COMPOSITIONS
-                .get(&(diacritic, letter))
-                .map(|s| s.to_string())
-                .unwrap_or_else(|| letter.to_string())
-        })
-        .to_string()
+    let mut out = String::with_capacity(title.len());
+    let mut last = 0;
+    for m in DIACRITIC_MARKS.find_iter(title) {
+        // Drop whitespace between a letter and the diacritic (e.g., "B ¨" -> "B¨")
+        let before = title[..m.start()].trim_end();
+        let keep_until = if before.ends_with(|c: char| c.is_ascii_alphabetic()) {
+            before.len().max(last)
+        } else {
+            m.start()
+        };
+        out.push_str(&title[last..keep_until]);
+
+        // Compose diacritic + optional whitespace + letter into precomposed character
+        let rest = &title[m.end()..];
+        let ws = rest.len() - rest.trim_start().len();
+        if rest[ws..].starts_with(|c: char| c.is_ascii_alphabetic()) {
+            let diacritic = &title[m.start()..m.end()];
+            let letter = &rest[ws..ws + 1];
+            out.push_str(
+                DIACRITIC_COMPOSITIONS
+                    .get(&(diacritic, letter))
+                    .unwrap_or(&letter),
+            );
+            last = m.end() + ws + 1;
+        } else {
+            out.push_str(&title[m.start()..m.end()]);
+            last = m.end();
+        }
+    }
+    out.push_str(&title[last..]);
+    out
 }
 
+/// Greek letters and mathematical symbols with their ASCII transliterations.
+/// NFKD normalization doesn't reduce these to ASCII, so they are rewritten first.
+static SYMBOL_TRANSLITERATIONS: &[(&str, &str)] = &[
+    // Greek letters
+    ("α", "alpha"),
+    ("Α", "alpha"),
+    ("β", "beta"),
+    ("Β", "beta"),
+    ("γ", "gamma"),
+    ("Γ", "gamma"),
+    ("δ", "delta"),
+    ("Δ", "delta"),
+    ("ε", "epsilon"),
+    ("Ε", "epsilon"),
+    ("ζ", "zeta"),
+    ("Ζ", "zeta"),
+    ("η", "eta"),
+    ("Η", "eta"),
+    ("θ", "theta"),
+    ("Θ", "theta"),
+    ("ι", "iota"),
+    ("Ι", "iota"),
+    ("κ", "kappa"),
+    ("Κ", "kappa"),
+    ("λ", "lambda"),
+    ("Λ", "lambda"),
+    ("μ", "mu"),
+    ("Μ", "mu"),
+    ("ν", "nu"),
+    ("Ν", "nu"),
+    ("ξ", "xi"),
+    ("Ξ", "xi"),
+    ("ο", "o"),
+    ("Ο", "o"),
+    ("π", "pi"),
+    ("Π", "pi"),
+    ("ρ", "rho"),
+    ("Ρ", "rho"),
+    ("σ", "sigma"),
+    ("ς", "sigma"),
+    ("Σ", "sigma"),
+    ("τ", "tau"),
+    ("Τ", "tau"),
+    ("υ", "upsilon"),
+    ("Υ", "upsilon"),
+    ("φ", "phi"),
+    ("Φ", "phi"),
+    ("χ", "chi"),
+    ("Χ", "chi"),
+    ("ψ", "psi"),
+    ("Ψ", "psi"),
+    ("ω", "omega"),
+    ("Ω", "omega"),
+    // Mathematical symbols
+    ("∞", "infinity"),
+    ("√", "sqrt"),
+    ("≤", "leq"),
+    ("≥", "geq"),
+    ("≠", "neq"),
+    ("±", "pm"),
+    ("×", "times"),
+    ("÷", "div"),
+    ("∑", "sum"),
+    ("∏", "prod"),
+    ("∫", "int"),
+    ("∂", "partial"),
+    ("∇", "nabla"),
+    ("∈", "in"),
+    ("∉", "notin"),
+    ("⊂", "subset"),
+    ("⊃", "supset"),
+    ("∪", "cup"),
+    ("∩", "cap"),
+    ("∧", "and"),
+    ("∨", "or"),
+    ("¬", "not"),
+    ("→", "to"),
+    ("←", "from"),
+    ("↔", "iff"),
+    ("⇒", "implies"),
+    ("⇐", "impliedby"),
+    ("⇔", "iff"),
+];
+
+/// Automaton over the [`SYMBOL_TRANSLITERATIONS`] keys, so every symbol is
+/// replaced in one scan instead of one `str::replace` pass per symbol.
+static SYMBOL_TRANSLITERATOR: Lazy<AhoCorasick> =
+    Lazy::new(|| AhoCorasick::new(SYMBOL_TRANSLITERATIONS.iter().map(|(from, _)| from)).unwrap());
+
 /// Normalize title for comparison — strips to lowercase alphanumeric only.
 ///
 /// Steps (order matters):
@@ -144,63 +249,14 @@ pub fn normalize_title(title: &str) -> String {
     // 2. Fix separated diacritics from PDF extraction (before NFKD)
     let title = fix_separated_diacritics(&title);
 
-    // 3. Transliterate Greek letters (NFKD doesn't convert these to ASCII)
-    let title = title
-        .replace(['α', 'Α'], "alpha")
-        .replace(['β', 'Β'], "beta")
-        .replace(['γ', 'Γ'], "gamma")
-        .replace(['δ', 'Δ'], "delta")
-        .replace(['ε', 'Ε'], "epsilon")
-        .replace(['ζ', 'Ζ'], "zeta")
-        .replace(['η', 'Η'], "eta")
-        .replace(['θ', 'Θ'], "theta")
-        .replace(['ι', 'Ι'], "iota")
-        .replace(['κ', 'Κ'], "kappa")
-        .replace(['λ', 'Λ'], "lambda")
-        .replace(['μ', 'Μ'], "mu")
-        .replace(['ν', 'Ν'], "nu")
-        .replace(['ξ', 'Ξ'], "xi")
-        .replace(['ο', 'Ο'], "o")
-        .replace(['π', 'Π'], "pi")
-        .replace(['ρ', 'Ρ'], "rho")
-        .replace(['σ', 'ς', 'Σ'], "sigma")
-        .replace(['τ', 'Τ'], "tau")
-        .replace(['υ', 'Υ'], "upsilon")
-        .replace(['φ', 'Φ'], "phi")
-        .replace(['χ', 'Χ'], "chi")
-        .replace(['ψ', 'Ψ'], "psi")
-        .replace(['ω', 'Ω'], "omega");
-
-    // 4. Replace mathematical symbols before NFKD strips them
-    let title = title
-        .replace('∞', "infinity")
-        .replace('√', "sqrt")
-        .replace('≤', "leq")
-        .replace('≥', "geq")
-        .replace('≠', "neq")
-        .replace('±', "pm")
-        .replace('×', "times")
-        .replace('÷', "div")
-        .replace('∑', "sum")
-        .replace('∏', "prod")
-        .replace('∫', "int")
-        .replace('∂', "partial")
-        .replace('∇', "nabla")
-        .replace('∈', "in")
-        .replace('∉', "notin")
-        .replace('⊂', "subset")
-        .replace('⊃', "supset")
-        .replace('∪', "cup")
-        .replace('∩', "cap")
-        .replace('∧', "and")
-        .replace('∨', "or")
-        .replace('¬', "not")
-        .replace('→', "to")
-        .replace('←', "from")
-        .replace('↔', "iff")
-        .replace('⇒', "implies")
-        .replace('⇐', "impliedby")
-        .replace('⇔', "iff");
+    // 3-4. Transliterate Greek letters and math symbols (NFKD doesn't convert
+    // these to ASCII) in a single pass
+    let mut transliterated = String::with_capacity(title.len());
+    SYMBOL_TRANSLITERATOR.replace_all_with(&title, &mut transliterated, |m, _, dst| {
+        dst.push_str(SYMBOL_TRANSLITERATIONS[m.pattern().as_usize()].1);
+        true
+    });
+    let title = transliterated;
 
     // 5-6. NFKD normalization and strip to ASCII
     let normalized: String = title.nfkd().filter(|c| c.is_ascii()).collect();
@@ -218,9 +274,39 @@ pub fn normalize_title(title: &str) -> String {
 /// false matches like `"Won't Somebody Think of the Children?"` matching
 /// `"Won't somebody think of the children?" Examining COPPA...` (different papers).
 pub fn titles_match(title_a: &str, title_b: &str) -> bool {
-    let norm_a = normalize_title(title_a);
-    let norm_b = normalize_title(title_b);
+    TitleMatcher::new(title_a).matches(title_b)
+}
+
+/// A reference title normalized once for repeated [`titles_match`] checks.
+///
+/// Backends compare one reference title against many candidates (search
+/// hits, index pages); building a matcher up front avoids re-normalizing
+/// the reference title for every candidate.
+pub struct TitleMatcher<'a> {
+    title: &'a str,
+    normalized: String,
+}
 
+impl<'a> TitleMatcher<'a> {
+    pub fn new(title: &'a str) -> Self {
+        Self {
+            title,
+            normalized: normalize_title(title),
+        }
+    }
+
+    /// Same result as `titles_match(title, candidate)`.
+    pub fn matches(&self, candidate: &str) -> bool {
+        normalized_titles_match(
+            self.title,
+            &self.normalized,
+            candidate,
+            &normalize_title(candidate),
+        )
+    }
+}
+
+fn normalized_titles_match(title_a: &str, norm_a: &str, title_b: &str, norm_b: &str) -> bool {
     if norm_a.is_empty() || norm_b.is_empty() {
         return false;
     }
@@ -232,9 +318,9 @@ pub fn titles_match(title_a: &str, title_b: &str) -> bool {
 
     // Conservative prefix matching with subtitle awareness
     let (shorter, longer) = if norm_a.len() <= norm_b.len() {
-        (&norm_a, &norm_b)
+        (norm_a, norm_b)
     } else {
-        (&norm_b, &norm_a)
+        (norm_b, norm_a)
     };
 
     // Only attempt prefix matching for titles of meaningful length
@@ -242,7 +328,7 @@ pub fn titles_match(title_a: &str, title_b: &str) -> bool {
         return false;
     }
 
-    if !longer.starts_with(shorter.as_str()) {
+    if !longer.starts_with(shorter) {
         return false;
     }
 
@@ -311,6 +397,23 @@ mod tests {
         ));
     }
 
+    #[test]
+    fn test_title_matcher_agrees_with_titles_match() {
+        let matcher = TitleMatcher::new("Won't Somebody Think of the Children?");
+        for candidate in [
+            "Won't somebody think of the children?",
+            "Won't somebody think of the children? Examining COPPA compliance at scale",
+            "A completely different paper",
+            "",
+        ] {
+            assert_eq!(
+                matcher.matches(candidate),
+                titles_match("Won't Somebody Think of the Children?", candidate),
+                "{candidate}"
+            );
+        }
+    }
+
     #[test]
     fn test_titles_no_match() {
         assert!(!titles_match(
@@ -450,6 +553,18 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_fix_separated_diacritics_direct() {
+        assert_eq!(fix_separated_diacritics("B ¨UNZ"), "BÜNZ");
+        assert_eq!(fix_separated_diacritics("Ord´o˜nez"), "Ordóñez");
+        // Whitespace (including newlines) between mark and letter is consumed
+        assert_eq!(fix_separated_diacritics("R´\nenyi"), "Rényi");
+        // Unmapped letter: mark is dropped, letter kept
+        assert_eq!(fix_separated_diacritics("¨b"), "b");
+        // Mark without a following letter is left alone
+        assert_eq!(fix_separated_diacritics("x ^ 2"), "x^ 2");
+    }
+
     // =========================================================================
     // Math symbol replacement
     // =========================================================================
@@ -5,19 +5,21 @@
 //! to per-DB drainer queues. Each drainer is the sole consumer of its DB's
 //! rate limiter, eliminating governor contention.
 
+use std::collections::HashMap;
 use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
 use std::sync::{Arc, Mutex};
 use std::time::Duration;
 
-use tokio::sync::oneshot;
+use tokio::sync::{oneshot, watch};
 use tokio::task::JoinHandle;
 use tokio_util::sync::CancellationToken;
 
 use crate::authors::validate_authors;
+use crate::cache::QueryCache;
 use crate::db::DatabaseBackend;
 use crate::db::searxng::Searxng;
 use crate::orchestrator::{build_database_list, query_local_databases};
-use crate::rate_limit::{self, DbQueryError, DoiContext};
+use crate::rate_limit::{self, CircuitBreaker, DbQueryError, DoiContext, RateLimiters};
 use crate::{
     Config, DbResult, DbStatus, DoiInfo, ProgressEvent, Reference, Status, ValidationResult,
 };
@@ -34,6 +36,21 @@ pub struct RefJob {
     pub progress: Arc<dyn Fn(ProgressEvent) + Send + Sync>,
 }
 
+/// Build the HTTP client used for database queries.
+///
+/// One client (and so one connection pool) should be shared by every request
+/// in a run: each DB host then keeps a couple of warm keep-alive connections,
+/// negotiating HTTP/2 where the host supports it, instead of paying a TCP +
+/// TLS handshake per client.
+pub fn http_client() -> reqwest::Client {
+    reqwest::Client::builder()
+        .pool_max_idle_per_host(2)
+        .pool_idle_timeout(Duration::from_secs(30))
+        .tcp_keepalive(Duration::from_secs(60))
+        .build()
+        .unwrap_or_else(|_| reqwest::Client::new())
+}
+
 /// A pool of coordinator + drainer tasks that process reference validation jobs.
 ///
 /// Submit jobs via [`submit()`](ValidationPool::submit), receive results via
@@ -49,12 +66,31 @@ impl ValidationPool {
     /// One drainer task is spawned per enabled remote DB. Coordinators handle
     /// local DBs inline, then fan out to per-DB drainer queues (including DOI).
     pub fn new(config: Arc<Config>, cancel: CancellationToken, num_workers: usize) -> Self {
+        Self::with_client(config, cancel, num_workers, http_client())
+    }
+
+    /// Like [`new()`](ValidationPool::new), but sends all requests through
+    /// `client`, so callers can share its connections with their own requests.
+    pub fn with_client(
+        config: Arc<Config>,
+        cancel: CancellationToken,
+        num_workers: usize,
+        client: reqwest::Client,
+    ) -> Self {
+        Self::with_gates(config, cancel, num_workers, client, HashMap::new())
+    }
+
+    /// Like [`with_client()`](ValidationPool::with_client), but the drainer of
+    /// each DB named in `gates` holds its queries until that gate reads `true`
+    /// (or its sender is dropped). Other DBs start right away.
+    pub(crate) fn with_gates(
+        config: Arc<Config>,
+        cancel: CancellationToken,
+        num_workers: usize,
+        client: reqwest::Client,
+        mut gates: HashMap<String, watch::Receiver<bool>>,
+    ) -> Self {
         let (job_tx, job_rx) = async_channel::unbounded::<RefJob>();
-        let client = reqwest::Client::builder()
-            .pool_max_idle_per_host(2)
-            .pool_idle_timeout(Duration::from_secs(30))
-            .build()
-            .unwrap_or_else(|_| reqwest::Client::new());
 
         // Build database list and partition into local/remote
         let all_dbs: Vec<Arc<dyn DatabaseBackend>> = build_database_list(&config, None)
@@ -77,6 +113,7 @@ impl ValidationPool {
                 config.clone(),
                 client.clone(),
                 cancel.clone(),
+                gates.remove(db.name()),
             )));
         }
 
@@ -204,11 +241,24 @@ async fn drainer_loop(
     config: Arc<Config>,
     client: reqwest::Client,
     cancel: CancellationToken,
+    gate: Option<watch::Receiver<bool>>,
 ) {
     let timeout = Duration::from_secs(config.db_timeout_secs);
     let rate_limiters = config.rate_limiters.clone();
     let cache = config.query_cache.clone();
     let requires_doi = db.requires_doi();
+    // Drainer is the sole consumer for this DB, so the breaker needs no locking
+    let mut breaker = CircuitBreaker::default();
+
+    // Hold queries until the caller has warmed the cache for this DB. A
+    // dropped sender also opens the gate.
+    if let Some(mut gate) = gate {
+        tokio::select! {
+            biased;
+            _ = cancel.cancelled() => {}
+            _ = gate.wait_for(|ready| *ready) => {}
+        }
+    }
 
     while let Ok(job) = rx.recv().await {
         let collector = &job.collector;
@@ -216,21 +266,21 @@ async fn drainer_loop(
         // Skip remaining jobs after cancellation
         if cancel.is_cancelled() {
             tracing::debug!(db = db.name(), title = %collector.title, "skipping: cancelled");
-            skip_and_decrement(collector, db.name()).await;
+            skip_and_decrement(collector, db.name(), None).await;
             continue;
         }
 
         // Skip if already verified by another drainer
         if collector.verified.load(Ordering::Acquire) {
             tracing::debug!(db = db.name(), title = %collector.title, "skipping: already verified");
-            skip_and_decrement(collector, db.name()).await;
+            skip_and_decrement(collector, db.name(), None).await;
             continue;
         }
 
         // DOI-requiring backends skip refs without a DOI
         if requires_doi && collector.reference.doi.is_none() {
             tracing::debug!(db = db.name(), title = %collector.title, "skipping: no DOI");
-            skip_and_decrement(collector, db.name()).await;
+            skip_and_decrement(collector, db.name(), None).await;
             continue;
         }
 
@@ -240,25 +290,92 @@ async fn drainer_loop(
             authors: &collector.reference.authors,
         });
 
-        // Query (includes cache check + governor acquire + HTTP call)
-        let rl_result = rate_limit::query_with_rate_limit(
-            db.as_ref(),
-            &collector.title,
-            &client,
-            timeout,
-            &rate_limiters,
-            cache.as_deref(),
-            doi_ctx.as_ref(),
-        )
-        .await;
+        // Cancellation abandons the request instead of waiting out its
+        // rate-limit waits, retries and timeout.
+        let rl_result = tokio::select! {
+            biased;
+            _ = cancel.cancelled() => {
+                tracing::debug!(db = db.name(), title = %collector.title, "abandoned: cancelled");
+                skip_and_decrement(collector, db.name(), None).await;
+                continue;
+            }
+            rl_result = query_through_breaker(
+                db.as_ref(),
+                &collector.title,
+                &client,
+                timeout,
+                &rate_limiters,
+                cache.as_deref(),
+                doi_ctx.as_ref(),
+                &mut breaker,
+            ) => rl_result,
+        };
 
         // Process result and decrement remaining
-        report_result(collector, db.name(), rl_result).await;
+        match rl_result {
+            Some(rl_result) => report_result(collector, db.name(), rl_result).await,
+            None => skip_and_decrement(collector, db.name(), Some(CIRCUIT_OPEN_REASON)).await,
+        }
+    }
+}
+
+/// Query one ref on a drainer's DB, honouring its circuit breaker.
+///
+/// Cached results are served first: they need no contact with the backend, so
+/// an open circuit must not turn them into errors, and they say nothing about
+/// the backend's health, so they are not recorded. Otherwise, while the circuit
+/// is open the query is not sent and `None` is returned; when closed, the
+/// backend is queried and the outcome recorded.
+#[allow(clippy::too_many_arguments)]
+async fn query_through_breaker(
+    db: &dyn DatabaseBackend,
+    title: &str,
+    client: &reqwest::Client,
+    timeout: Duration,
+    rate_limiters: &RateLimiters,
+    cache: Option<&QueryCache>,
+    doi_ctx: Option<&DoiContext<'_>>,
+    breaker: &mut CircuitBreaker,
+) -> Option<rate_limit::RateLimitedResult> {
+    if let Some(cached) = rate_limit::cached_query_result(db, title, cache) {
+        return Some(cached);
+    }
+
+    if breaker.is_open() {
+        tracing::debug!(db = db.name(), title, "skipping: circuit open");
+        return None;
+    }
+
+    let rl_result = rate_limit::query_backend_with_rate_limit(
+        db,
+        title,
+        client,
+        timeout,
+        rate_limiters,
+        cache,
+        doi_ctx,
+    )
+    .await;
+
+    if breaker.record(&rl_result.result) {
+        tracing::warn!(
+            db = db.name(),
+            cooldown_secs = breaker.cooldown().as_secs(),
+            "circuit opened after repeated failures; skipping this DB during cooldown"
+        );
     }
+    Some(rl_result)
 }
 
+/// Reason recorded for refs skipped because their DB's circuit is open.
+const CIRCUIT_OPEN_REASON: &str = "circuit open after repeated failures";
+
 /// Emit a Skipped event and decrement the collector's remaining counter.
-async fn skip_and_decrement(collector: &RefCollector, db_name: &str) {
+///
+/// A `reason` marks a skip caused by the DB rather than the ref (an open
+/// circuit): it is recorded as the result's error message and the DB is added
+/// to `failed_dbs`, so the ref stays eligible for the retry pass.
+async fn skip_and_decrement(collector: &RefCollector, db_name: &str, reason: Option<&str>) {
     (collector.progress)(ProgressEvent::DatabaseQueryComplete {
         paper_index: 0,
         ref_index: collector.ref_index,
@@ -275,8 +392,11 @@ async fn skip_and_decrement(collector: &RefCollector, db_name: &str) {
             elapsed: None,
             found_authors: vec![],
             paper_url: None,
-            error_message: None,
+            error_message: reason.map(str::to_string),
         });
+        if reason.is_some() {
+            state.failed_dbs.push(db_name.to_string());
+        }
     }
 
     if collector.remaining.fetch_sub(1, Ordering::AcqRel) == 1 {
@@ -1093,12 +1213,31 @@ fn emit_final_events(
                 result.source.as_deref().unwrap_or("unknown")
             ),
         };
+        // DBs skipped on an open circuit were never queried, so keep them
+        // apart from the ones that actually failed.
+        let (skipped, timed_out): (Vec<&str>, Vec<&str>) = result
+            .failed_dbs
+            .iter()
+            .map(String::as_str)
+            .partition(|db| {
+                result
+                    .db_results
+                    .iter()
+                    .any(|r| r.db_name == *db && r.status == DbStatus::Skipped)
+            });
+        let mut reasons = Vec::new();
+        if !timed_out.is_empty() {
+            reasons.push(format!("{} timed out", timed_out.join(", ")));
+        }
+        if !skipped.is_empty() {
+            reasons.push(format!("{} skipped (circuit open)", skipped.join(", ")));
+        }
         progress(ProgressEvent::Warning {
             index: ref_index,
             total,
             title: title.to_string(),
             failed_dbs: result.failed_dbs.clone(),
-            message: format!("{} timed out; {}", result.failed_dbs.join(", "), context),
+            message: format!("{}; {}", reasons.join("; "), context),
         });
     }
 
@@ -1131,3 +1270,124 @@ fn build_validation_result(
         retraction_info,
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::db::DbQueryResult;
+    use crate::db::mock::{MockDb, MockResponse};
+
+    async fn query(
+        db: &MockDb,
+        title: &str,
+        cache: &QueryCache,
+        breaker: &mut CircuitBreaker,
+    ) -> Option<rate_limit::RateLimitedResult> {
+        query_through_breaker(
+            db,
+            title,
+            &reqwest::Client::new(),
+            Duration::from_secs(1),
+            &RateLimiters::default(),
+            Some(cache),
+            None,
+            breaker,
+        )
+        .await
+    }
+
+    #[tokio::test]
+    async fn cached_ref_resolves_while_circuit_open() {
+        let db = MockDb::new("TestDB", MockResponse::Error("connection refused".into()));
+        let cache = QueryCache::default();
+        cache.insert(
+            "Cached Paper",
+            "TestDB",
+            &DbQueryResult::found("Cached Paper", vec!["Smith".into()], None),
+        );
+        let mut breaker = CircuitBreaker::new(1, Duration::from_secs(60));
+
+        // One real failure opens the circuit
+        let rl = query(&db, "Other Paper", &cache, &mut breaker).await;
+        assert!(rl.unwrap().result.is_err());
+        assert!(breaker.is_open());
+
+        // The cached ref is still served, without touching the backend
+        let rl = query(&db, "Cached Paper", &cache, &mut breaker).await;
+        assert!(rl.unwrap().result.unwrap().is_found());
+        assert_eq!(db.call_count(), 1);
+
+        // Uncached refs are skipped while the circuit is open
+        assert!(
+            query(&db, "Third Paper", &cache, &mut breaker)
+                .await
+                .is_none()
+        );
+        assert_eq!(db.call_count(), 1);
+    }
+
+    #[tokio::test]
+    async fn cache_hits_do_not_reset_breaker() {
+        let db = MockDb::new("TestDB", MockResponse::Error("connection refused".into()));
+        let cache = QueryCache::default();
+        cache.insert(
+            "Cached Paper",
+            "TestDB",
+            &DbQueryResult::found("Cached Paper", vec!["Smith".into()], None),
+        );
+        let mut breaker = CircuitBreaker::new(2, Duration::from_secs(60));
+
+        let _ = query(&db, "Paper A", &cache, &mut breaker).await;
+        let _ = query(&db, "Cached Paper", &cache, &mut breaker).await;
+        let _ = query(&db, "Paper B", &cache, &mut breaker).await;
+
+        // Two consecutive backend failures, despite the hit in between
+        assert!(breaker.is_open());
+        assert_eq!(db.call_count(), 2);
+    }
+
+    #[test]
+    fn warning_separates_circuit_skips_from_timeouts() {
+        let db_result = |db_name: &str, status| DbResult {
+            db_name: db_name.into(),
+            status,
+            elapsed: None,
+            found_authors: vec![],
+            paper_url: None,
+            error_message: None,
+        };
+        let result = ValidationResult {
+            title: "Paper".into(),
+            raw_citation: String::new(),
+            ref_authors: vec![],
+            status: Status::NotFound,
+            source: None,
+            found_authors: vec![],
+            paper_url: None,
+            failed_dbs: vec!["CrossRef".into(), "DBLP".into()],
+            db_results: vec![
+                db_result("CrossRef", DbStatus::Error),
+                db_result("DBLP", DbStatus::Skipped),
+            ],
+            doi_info: None,
+            arxiv_info: None,
+            retraction_info: None,
+        };
+
+        let messages = Mutex::new(Vec::new());
+        let progress = |event: ProgressEvent| {
+            if let ProgressEvent::Warning { message, .. } = event {
+                messages.lock().unwrap().push(message);
+            }
+        };
+        emit_final_events(&progress, &result, 0, 1, "Paper");
+
+        assert_eq!(
+            *messages.lock().unwrap(),
+            vec![
+                "CrossRef timed out; DBLP skipped (circuit open); not found in other DBs"
+                    .to_string()
+            ]
+        );
+    }
+}
@@ -132,6 +132,76 @@ impl AdaptiveDbLimiter {
     }
 }
 
+/// Per-DB circuit breaker that stops querying a backend after repeated failures.
+///
+/// After `threshold` consecutive errors the circuit opens for `cooldown`;
+/// while open, callers should skip the DB instead of waiting on another
+/// timeout. Once the cooldown elapses the next query is attempted normally.
+/// Rate-limit responses are not counted — [`AdaptiveDbLimiter`] handles those.
+pub struct CircuitBreaker {
+    threshold: u32,
+    cooldown: Duration,
+    consecutive_failures: u32,
+    open_until: Option<Instant>,
+}
+
+impl Default for CircuitBreaker {
+    fn default() -> Self {
+        Self::new(
+            Self::DEFAULT_THRESHOLD,
+            Duration::from_secs(Self::DEFAULT_COOLDOWN_SECS),
+        )
+    }
+}
+
+impl CircuitBreaker {
+    /// Consecutive failures before the circuit opens.
+    pub const DEFAULT_THRESHOLD: u32 = 5;
+    /// How long the circuit stays open, in seconds.
+    pub const DEFAULT_COOLDOWN_SECS: u64 = 60;
+
+    /// Create a breaker that opens after `threshold` consecutive failures.
+    pub fn new(threshold: u32, cooldown: Duration) -> Self {
+        Self {
+            threshold: threshold.max(1),
+            cooldown,
+            consecutive_failures: 0,
+            open_until: None,
+        }
+    }
+
+    /// Whether the circuit is currently open (the DB should be skipped).
+    pub fn is_open(&self) -> bool {
+        self.open_until.is_some_and(|t| Instant::now() < t)
+    }
+
+    /// The configured cooldown period.
+    pub fn cooldown(&self) -> Duration {
+        self.cooldown
+    }
+
+    /// Record the outcome of a query. Returns `true` if this call opened the circuit.
+    pub fn record(&mut self, result: &Result<DbQueryResult, DbQueryError>) -> bool {
+        match result {
+            Ok(_) => {
+                self.consecutive_failures = 0;
+                false
+            }
+            Err(DbQueryError::RateLimited { .. }) => false,
+            Err(DbQueryError::Other(_)) => {
+                self.consecutive_failures += 1;
+                if self.consecutive_failures >= self.threshold {
+                    self.consecutive_failures = 0;
+                    self.open_until = Some(Instant::now() + self.cooldown);
+                    true
+                } else {
+                    false
+                }
+            }
+        }
+    }
+}
+
 /// Collection of per-database rate limiters.
 pub struct RateLimiters {
     limiters: HashMap<&'static str, AdaptiveDbLimiter>,
@@ -284,18 +354,55 @@ pub async fn query_with_rate_limit(
     doi_context: Option<&DoiContext<'_>>,
 ) -> RateLimitedResult {
     // Check cache before making any network request or waiting on the governor.
-    // Skip cache for local/offline backends — they have their own SQLite DBs.
-    let use_cache = !db.is_local();
-    if use_cache
-        && let Some(c) = cache
-        && let Some(cached_result) = c.get(title, db.name())
-    {
-        tracing::debug!(db = db.name(), title, "cache hit");
-        return RateLimitedResult {
-            result: Ok(cached_result),
-            elapsed: Duration::ZERO,
-        };
+    if let Some(cached) = cached_query_result(db, title, cache) {
+        return cached;
     }
+    query_backend_with_rate_limit(
+        db,
+        title,
+        client,
+        timeout,
+        rate_limiters,
+        cache,
+        doi_context,
+    )
+    .await
+}
+
+/// Look up a cached result for a remote backend.
+///
+/// Always `None` for local/offline backends — they have their own SQLite DBs.
+pub fn cached_query_result(
+    db: &dyn DatabaseBackend,
+    title: &str,
+    cache: Option<&QueryCache>,
+) -> Option<RateLimitedResult> {
+    if db.is_local() {
+        return None;
+    }
+    let cached_result = cache?.get(title, db.name())?;
+    tracing::debug!(db = db.name(), title, "cache hit");
+    Some(RateLimitedResult {
+        result: Ok(cached_result),
+        elapsed: Duration::ZERO,
+    })
+}
+
+/// Query the backend itself (governor acquire + HTTP call), skipping the cache
+/// lookup; successful results are still written to `cache`.
+///
+/// Every result returned here comes from a real request, so callers can feed
+/// it to a [`CircuitBreaker`].
+pub async fn query_backend_with_rate_limit(
+    db: &dyn DatabaseBackend,
+    title: &str,
+    client: &reqwest::Client,
+    timeout: Duration,
+    rate_limiters: &RateLimiters,
+    cache: Option<&QueryCache>,
+    doi_context: Option<&DoiContext<'_>>,
+) -> RateLimitedResult {
+    let use_cache = !db.is_local();
 
     // Skip rate limiting for local/offline backends (SQLite queries need no throttling)
     let limiter = if db.is_local() {
@@ -504,6 +611,46 @@ mod tests {
         assert_eq!(limiter.current_factor.load(Ordering::SeqCst), 1);
     }
 
+    // ── CircuitBreaker ─────────────────────────────────────────────────
+
+    fn other_err() -> Result<DbQueryResult, DbQueryError> {
+        Err(DbQueryError::Other("timeout".into()))
+    }
+
+    #[test]
+    fn breaker_opens_after_threshold() {
+        let mut breaker = CircuitBreaker::new(3, Duration::from_secs(60));
+        assert!(!breaker.record(&other_err()));
+        assert!(!breaker.record(&other_err()));
+        assert!(!breaker.is_open());
+        assert!(breaker.record(&other_err()));
+        assert!(breaker.is_open());
+    }
+
+    #[test]
+    fn breaker_success_resets_count() {
+        let mut breaker = CircuitBreaker::new(2, Duration::from_secs(60));
+        breaker.record(&other_err());
+        breaker.record(&Ok(DbQueryResult::not_found()));
+        assert!(!breaker.record(&other_err()));
+        assert!(!breaker.is_open());
+    }
+
+    #[test]
+    fn breaker_ignores_rate_limits() {
+        let mut breaker = CircuitBreaker::new(1, Duration::from_secs(60));
+        let limited = Err(DbQueryError::RateLimited { retry_after: None });
+        assert!(!breaker.record(&limited));
+        assert!(!breaker.is_open());
+    }
+
+    #[test]
+    fn breaker_closes_after_cooldown() {
+        let mut breaker = CircuitBreaker::new(1, Duration::ZERO);
+        assert!(breaker.record(&other_err()));
+        assert!(!breaker.is_open());
+    }
+
     // ── RateLimiters ───────────────────────────────────────────────────
 
     #[test]
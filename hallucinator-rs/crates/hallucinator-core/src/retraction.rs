@@ -1,4 +1,4 @@
-use crate::matching::titles_match;
+use crate::matching::TitleMatcher;
 use std::time::Duration;
 
 /// Result of a retraction check.
@@ -169,6 +169,7 @@ pub async fn check_retraction_by_title(
         .cloned()
         .unwrap_or_default();
 
+    let matcher = TitleMatcher::new(title);
     for item in items {
         let found_title = item["title"]
             .as_array()
@@ -176,7 +177,7 @@ pub async fn check_retraction_by_title(
             .and_then(|v| v.as_str())
             .unwrap_or("");
 
-        if !titles_match(title, found_title) {
+        if !matcher.matches(found_title) {
             continue;
         }
 
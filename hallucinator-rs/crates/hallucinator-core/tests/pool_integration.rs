@@ -205,3 +205,40 @@ async fn progress_events_emitted() {
         "should emit Result event, got: {collected:?}"
     );
 }
+
+#[tokio::test]
+async fn duplicate_titles_checked_once() {
+    let mut refs = vec![
+        dummy_ref("A Test Paper"),
+        dummy_ref("Another Paper"),
+        dummy_ref("A test paper."),
+    ];
+    refs[2].raw_citation = "[3] A test paper.".into();
+
+    let checking: Arc<Mutex<Vec<usize>>> = Arc::new(Mutex::new(Vec::new()));
+    let checking_clone = checking.clone();
+    let progress = move |event: ProgressEvent| {
+        if let ProgressEvent::Checking { index, .. } = event {
+            checking_clone.lock().unwrap().push(index);
+        }
+    };
+
+    let results = hallucinator_core::check_references(
+        refs,
+        config_no_network(),
+        progress,
+        CancellationToken::new(),
+    )
+    .await;
+
+    assert_eq!(results.len(), 3);
+    // Duplicate keeps its own title/citation but shares the first result
+    assert_eq!(results[2].title, "A test paper.");
+    assert_eq!(results[2].raw_citation, "[3] A test paper.");
+    assert_eq!(results[2].status, results[0].status);
+
+    // Every index still gets a Checking event
+    let mut indices = checking.lock().unwrap().clone();
+    indices.sort();
+    assert_eq!(indices, vec![0, 1, 2]);
+}
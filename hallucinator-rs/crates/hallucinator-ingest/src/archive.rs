@@ -1,5 +1,6 @@
 use flate2::read::GzDecoder;
-use std::io::Read;
+use std::fs::File;
+use std::io::{BufReader, Read, Seek, SeekFrom, Write};
 use std::path::{Path, PathBuf};
 use std::sync::mpsc;
 use tar::Archive;
@@ -51,6 +52,34 @@ fn passes_magic_check(name: &str, data: &[u8]) -> bool {
     }
 }
 
+/// Copy one archive entry to `out_path`, streaming instead of buffering it whole.
+///
+/// Only the first few bytes are held for the magic check; returns `Ok(false)`
+/// without creating the file if the entry fails it.
+fn copy_entry(
+    entry: &mut impl Read,
+    name: &str,
+    out_path: &Path,
+    out_name: &str,
+) -> Result<bool, String> {
+    let mut head = Vec::with_capacity(5);
+    entry
+        .by_ref()
+        .take(5)
+        .read_to_end(&mut head)
+        .map_err(|e| format!("Failed to extract {}: {}", name, e))?;
+
+    if !passes_magic_check(name, &head) {
+        return Ok(false);
+    }
+
+    let write_err = |e: std::io::Error| format!("Failed to write {}: {}", out_name, e);
+    let mut out = File::create(out_path).map_err(write_err)?;
+    out.write_all(&head).map_err(write_err)?;
+    std::io::copy(entry, &mut out).map_err(|e| format!("Failed to extract {}: {}", name, e))?;
+    Ok(true)
+}
+
 /// Read an archive file from disk, detect its type, and extract PDFs into `dir`.
 ///
 /// Supports ZIP and tar.gz archives. Type is detected by extension and magic bytes.
@@ -285,19 +314,31 @@ pub fn extract_archive_streaming(
     max_size: u64,
     tx: &mpsc::Sender<ArchiveItem>,
 ) -> Result<(), String> {
-    let data = std::fs::read(archive_path)
-        .map_err(|e| format!("Failed to read archive {}: {}", archive_path.display(), e))?;
+    // Read entries straight from the file rather than loading the whole
+    // archive into memory; only the magic bytes are read up front.
+    let read_err =
+        |e: std::io::Error| format!("Failed to read archive {}: {}", archive_path.display(), e);
+    let mut file = File::open(archive_path).map_err(read_err)?;
+    let mut magic = Vec::with_capacity(2);
+    (&mut file)
+        .take(2)
+        .read_to_end(&mut magic)
+        .map_err(read_err)?;
+    file.seek(SeekFrom::Start(0)).map_err(read_err)?;
+    let reader = BufReader::new(file);
 
     let name = archive_path
         .file_name()
         .map(|n| n.to_string_lossy().to_lowercase())
         .unwrap_or_default();
 
-    if name.ends_with(".zip") || data.starts_with(b"PK") {
-        extract_from_zip_streaming(&data, dir, max_size, tx)
-    } else if name.ends_with(".tar.gz") || name.ends_with(".tgz") || data.starts_with(&[0x1f, 0x8b])
+    if name.ends_with(".zip") || magic.starts_with(b"PK") {
+        extract_from_zip_streaming(reader, dir, max_size, tx)
+    } else if name.ends_with(".tar.gz")
+        || name.ends_with(".tgz")
+        || magic.starts_with(&[0x1f, 0x8b])
     {
-        extract_from_tar_gz_streaming(&data, dir, max_size, tx)
+        extract_from_tar_gz_streaming(reader, dir, max_size, tx)
     } else {
         Err(format!(
             "Unsupported archive format: {}",
@@ -307,15 +348,14 @@ pub fn extract_archive_streaming(
 }
 
 /// Streaming ZIP extraction — sends each file through the channel as it's extracted.
-fn extract_from_zip_streaming(
-    data: &[u8],
+fn extract_from_zip_streaming<R: Read + Seek>(
+    reader: R,
     dir: &Path,
     max_size: u64,
     tx: &mpsc::Sender<ArchiveItem>,
 ) -> Result<(), String> {
-    let cursor = std::io::Cursor::new(data);
     let mut archive =
-        zip::ZipArchive::new(cursor).map_err(|e| format!("Failed to open ZIP: {}", e))?;
+        zip::ZipArchive::new(reader).map_err(|e| format!("Failed to open ZIP: {}", e))?;
 
     let mut total: usize = 0;
     let mut total_size: u64 = 0;
@@ -368,17 +408,10 @@ fn extract_from_zip_streaming(
         let out_name = format!("{}_{}", i, basename);
         let out_path = dir.join(&out_name);
 
-        let mut buf = Vec::new();
-        file.read_to_end(&mut buf)
-            .map_err(|e| format!("Failed to extract {}: {}", name_str, e))?;
-
-        if !passes_magic_check(&name_str, &buf) {
+        if !copy_entry(&mut file, &name_str, &out_path, &out_name)? {
             continue;
         }
 
-        std::fs::write(&out_path, &buf)
-            .map_err(|e| format!("Failed to write {}: {}", out_name, e))?;
-
         total += 1;
         if tx
             .send(ArchiveItem::Pdf(ExtractedPdf {
@@ -400,13 +433,13 @@ fn extract_from_zip_streaming(
 }
 
 /// Streaming tar.gz extraction — sends each file through the channel as it's extracted.
-fn extract_from_tar_gz_streaming(
-    data: &[u8],
+fn extract_from_tar_gz_streaming<R: Read>(
+    reader: R,
     dir: &Path,
     max_size: u64,
     tx: &mpsc::Sender<ArchiveItem>,
 ) -> Result<(), String> {
-    let gz = GzDecoder::new(data);
+    let gz = GzDecoder::new(reader);
     let mut archive = Archive::new(gz);
 
     let entries = archive
@@ -464,18 +497,10 @@ fn extract_from_tar_gz_streaming(
         let out_name = format!("{}_{}", i, basename);
         let out_path = dir.join(&out_name);
 
-        let mut buf = Vec::new();
-        entry
-            .read_to_end(&mut buf)
-            .map_err(|e| format!("Failed to extract {}: {}", name_str, e))?;
-
-        if !passes_magic_check(&name_str, &buf) {
+        if !copy_entry(&mut entry, &name_str, &out_path, &out_name)? {
             continue;
         }
 
-        std::fs::write(&out_path, &buf)
-            .map_err(|e| format!("Failed to write {}: {}", out_name, e))?;
-
         total += 1;
         if tx
             .send(ArchiveItem::Pdf(ExtractedPdf {
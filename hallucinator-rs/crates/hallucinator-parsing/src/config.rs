@@ -27,6 +27,19 @@ impl<T: Clone> ListOverride<T> {
             }
         }
     }
+
+    /// Iterate over the effective list without cloning it.
+    ///
+    /// Prefer this over [`resolve`](Self::resolve) for compiled regexes: a
+    /// cloned `Regex` starts with an empty match cache that must be rebuilt.
+    pub fn iter<'a>(&'a self, defaults: &'a [T]) -> impl Iterator<Item = &'a T> + 'a {
+        let (base, extra): (&[T], &[T]) = match self {
+            ListOverride::Default => (defaults, &[]),
+            ListOverride::Replace(v) => (v, &[]),
+            ListOverride::Extend(v) => (defaults, v),
+        };
+        base.iter().chain(extra)
+    }
 }
 
 /// Configuration for the reference extraction pipeline.
@@ -351,4 +364,17 @@ mod tests {
             vec!["a".to_string(), "b".to_string(), "c".to_string()]
         );
     }
+
+    #[test]
+    fn test_list_override_iter_matches_resolve() {
+        let defaults = vec!["a".to_string(), "b".to_string()];
+        for o in [
+            ListOverride::Default,
+            ListOverride::Replace(vec!["x".to_string()]),
+            ListOverride::Extend(vec!["c".to_string()]),
+        ] {
+            let iterated: Vec<String> = o.iter(&defaults).cloned().collect();
+            assert_eq!(iterated, o.resolve(&defaults));
+        }
+    }
 }
@@ -1,4 +1,5 @@
 use once_cell::sync::Lazy;
+use rayon::prelude::*;
 use regex::Regex;
 use std::path::Path;
 
@@ -74,22 +75,31 @@ impl ReferenceExtractor {
         // Expand typographic ligatures (ﬁ → fi, ﬂ → fl, etc.) early in the pipeline
         // so all downstream steps see clean ASCII text.
         let text = text_processing::expand_ligatures(text);
-        let ref_section = self
-            .find_references_section(&text)
+        // Borrow the section from `text` rather than copying it out.
+        let ref_section = section::find_references_section_str(&text, &self.config)
             .ok_or(ParsingError::NoReferencesSection)?;
 
-        let raw_refs = self.segment_references(&ref_section);
+        let raw_refs = self.segment_references(ref_section);
 
         let mut stats = SkipStats {
             total_raw: raw_refs.len(),
             ..Default::default()
         };
 
-        let mut references = Vec::new();
-        let mut previous_authors: Vec<String> = Vec::new();
+        // References parse independently, so do the heavy work in parallel.
+        // Only em-dash "same authors" resolution depends on the previous
+        // reference, and that is applied in order below.
+        let parsed_refs: Vec<ParsedRef> = raw_refs
+            .par_iter()
+            .map(|ref_text| parse_single_reference_unresolved(ref_text, &self.config))
+            .collect();
 
-        for (raw_idx, ref_text) in raw_refs.iter().enumerate() {
-            let parsed = parse_single_reference(ref_text, &previous_authors, &self.config);
+        let mut references: Vec<Reference> = Vec::new();
+        // Index of the last reference with authors, whose list is lent to the
+        // next reference for em-dash "same authors" handling instead of cloned.
+        let mut previous_authors: Option<usize> = None;
+
+        for (raw_idx, parsed) in parsed_refs.into_iter().enumerate() {
             match parsed {
                 ParsedRef::Skip(reason, raw_citation, title) => {
                     match reason {
@@ -110,11 +120,13 @@ impl ReferenceExtractor {
                     });
                 }
                 ParsedRef::Ref(mut r) => {
+                    let prev = previous_authors.map_or(&[][..], |i| &references[i].authors[..]);
+                    resolve_same_as_previous(&mut r.authors, prev);
                     r.original_number = raw_idx + 1; // 1-based
                     if r.authors.is_empty() {
                         stats.no_authors += 1;
                     } else {
-                        previous_authors = r.authors.clone();
+                        previous_authors = Some(references.len());
                     }
                     references.push(r);
                 }
@@ -147,6 +159,23 @@ fn parse_single_reference(
     prev_authors: &[String],
     config: &ParsingConfig,
 ) -> ParsedRef {
+    let mut parsed = parse_single_reference_unresolved(ref_text, config);
+    if let ParsedRef::Ref(r) = &mut parsed {
+        resolve_same_as_previous(&mut r.authors, prev_authors);
+    }
+    parsed
+}
+
+/// Replace an em-dash "same authors as previous" marker with `prev_authors`.
+fn resolve_same_as_previous(ref_authors: &mut Vec<String>, prev_authors: &[String]) {
+    if ref_authors.len() == 1 && ref_authors[0] == authors::SAME_AS_PREVIOUS {
+        *ref_authors = prev_authors.to_vec();
+    }
+}
+
+/// Like [`parse_single_reference`], but leaves the em-dash marker in
+/// `authors` so references can be parsed independently of each other.
+fn parse_single_reference_unresolved(ref_text: &str, config: &ParsingConfig) -> ParsedRef {
     // Extract DOI and arXiv ID BEFORE fixing hyphenation
     let doi = identifiers::extract_doi(ref_text);
     let arxiv_id = identifiers::extract_arxiv_id(ref_text);
@@ -159,15 +188,13 @@ fn parse_single_reference(
     let ref_text = text_processing::fix_hyphenation_with_config(&ref_text, config);
 
     // Skip entries with non-academic URLs
-    static URL_RE: Lazy<Regex> = Lazy::new(|| Regex::new(r"https?\s*:\s*//").unwrap());
-    static BROKEN_URL_RE: Lazy<Regex> = Lazy::new(|| Regex::new(r"ht\s*tps?\s*:\s*//").unwrap());
+    // One pattern covers both intact ("https://") and PDF-broken ("ht tps://") URLs.
+    static URL_RE: Lazy<Regex> = Lazy::new(|| Regex::new(r"ht\s*tps?\s*:\s*//").unwrap());
     static ACADEMIC_URL_RE: Lazy<Regex> = Lazy::new(|| {
         Regex::new(r"(?i)(acm\.org|ieee\.org|usenix\.org|arxiv\.org|doi\.org)").unwrap()
     });
 
-    if (URL_RE.is_match(&ref_text) || BROKEN_URL_RE.is_match(&ref_text))
-        && !ACADEMIC_URL_RE.is_match(&ref_text)
-    {
+    if URL_RE.is_match(&ref_text) && !ACADEMIC_URL_RE.is_match(&ref_text) {
         // Still extract a title for display purposes even though we're skipping
         let (extracted_title, from_quotes) =
             title::extract_title_from_reference_with_config(&ref_text, config);
@@ -188,7 +215,10 @@ fn parse_single_reference(
         title::extract_title_from_reference_with_config(&ref_text, config);
     let cleaned_title = title::clean_title_with_config(&extracted_title, from_quotes, config);
 
-    if cleaned_title.is_empty() || cleaned_title.split_whitespace().count() < config.min_title_words
+    // Stop counting once the threshold is reached; long titles never need a full scan.
+    let min_words = config.min_title_words;
+    if cleaned_title.is_empty()
+        || cleaned_title.split_whitespace().take(min_words).count() < min_words
     {
         // Short titles can still be real citations if we have strong signals:
         // DOI, arXiv ID, or venue/year markers in the raw text.
@@ -209,17 +239,8 @@ fn parse_single_reference(
         }
     }
 
-    // Extract authors
-    let mut ref_authors = authors::extract_authors_from_reference_with_config(&ref_text, config);
-
-    // Handle em-dash "same authors as previous"
-    if ref_authors.len() == 1 && ref_authors[0] == authors::SAME_AS_PREVIOUS {
-        if !prev_authors.is_empty() {
-            ref_authors = prev_authors.to_vec();
-        } else {
-            ref_authors = vec![];
-        }
-    }
+    // Extract authors (an em-dash "same authors" marker is resolved by the caller)
+    let ref_authors = authors::extract_authors_from_reference_with_config(&ref_text, config);
 
     // Clean up raw citation for display
     static WS_RE: Lazy<Regex> = Lazy::new(|| Regex::new(r"\s+").unwrap());
@@ -51,6 +51,14 @@ pub(crate) fn find_references_section_with_config(
     text: &str,
     config: &ParsingConfig,
 ) -> Option<String> {
+    find_references_section_str(text, config).map(str::to_string)
+}
+
+/// Like [`find_references_section_with_config`], but borrows the section from `text`.
+pub(crate) fn find_references_section_str<'a>(
+    text: &'a str,
+    config: &ParsingConfig,
+) -> Option<&'a str> {
     static HEADER_RE: Lazy<Regex> = Lazy::new(|| {
         Regex::new(r"(?i)\n\s*(?:References|Bibliography|Works\s+Cited)\s*\n").unwrap()
     });
@@ -60,8 +68,7 @@ pub(crate) fn find_references_section_with_config(
     // Use the LAST "References" header, not the first.
     // Some papers have multiple "References" headers (e.g., table headers like
     // "Table 2: References to related work") before the actual reference list.
-    let matches: Vec<_> = header_re.find_iter(text).collect();
-    if let Some(m) = matches.last() {
+    if let Some(m) = header_re.find_iter(text).last() {
         let ref_start = m.end();
         let rest = &text[ref_start..];
 
@@ -88,7 +95,7 @@ pub(crate) fn find_references_section_with_config(
 
         let section = &rest[..ref_end];
         if !section.trim().is_empty() {
-            return Some(section.to_string());
+            return Some(section);
         }
     }
 
@@ -100,7 +107,7 @@ pub(crate) fn find_references_section_with_config(
         .map(|(i, _)| i)
         .find(|&i| i >= cutoff)
         .unwrap_or(cutoff);
-    Some(text[cutoff..].to_string())
+    Some(&text[cutoff..])
 }
 
 /// Strip conference page headers/footers that get embedded in PDF text extraction.
@@ -304,9 +311,9 @@ fn try_ieee_with_config(ref_text: &str, config: &ParsingConfig) -> Option<Vec<St
 
     // Extract the captured numbers to check sequentiality
     // This prevents matching years like [2017], [2020] in author-year citations
-    let caps: Vec<_> = re.captures_iter(ref_text).collect();
-    let first_nums: Vec<i64> = caps
-        .iter()
+    // Only the first five are checked, so only those are captured.
+    let first_nums: Vec<i64> = re
+        .captures_iter(ref_text)
         .take(5)
         .filter_map(|c| c.get(1)?.as_str().parse().ok())
         .collect();
@@ -351,9 +358,9 @@ fn try_numbered_with_config(ref_text: &str, config: &ParsingConfig) -> Option<Ve
 
     // Extract the captured numbers to check sequentiality
     // When using a custom regex, we still need capture group 1 for numbers
-    let caps: Vec<_> = re.captures_iter(ref_text).collect();
-    let first_nums: Vec<i64> = caps
-        .iter()
+    // Only the first five are checked, so only those are captured.
+    let first_nums: Vec<i64> = re
+        .captures_iter(ref_text)
         .take(5)
         .filter_map(|c| c.get(1)?.as_str().parse().ok())
         .collect();
@@ -385,25 +392,30 @@ fn try_numbered_with_config(ref_text: &str, config: &ParsingConfig) -> Option<Ve
 }
 
 fn try_aaai(ref_text: &str) -> Option<Vec<String>> {
-    // Surname chars: ASCII letters + common diacritics (Latin Extended)
-    let sc = r"[a-zA-Z\u{00C0}-\u{024F}\u{00E4}\u{00F6}\u{00FC}\u{00DF}\u{00E8}\u{00E9}]";
-
     // AAAI pattern: end of previous ref (lowercase/digit/paren/CAPS/slash). + newline
     // + optional page number line + Surname, I. (next ref start)
     // Rust regex doesn't support look-ahead, so we match without (?!In\s) and filter in code
-    let re_pattern = format!(
-        r"([a-z0-9)/]|[A-Z]{{2}})\.\n(?:\d{{1,4}}\n)?\s*({}{}+(?:[ \-]{}+)?,\s+[A-Z]\.)",
-        r"[A-Z\u{00C0}-\u{024F}]", sc, sc,
-    );
-    let re = Regex::new(&re_pattern).unwrap();
+    static AAAI_RE: Lazy<Regex> = Lazy::new(|| {
+        // Surname chars: ASCII letters + common diacritics (Latin Extended)
+        let sc = r"[a-zA-Z\u{00C0}-\u{024F}\u{00E4}\u{00F6}\u{00FC}\u{00DF}\u{00E8}\u{00E9}]";
+        Regex::new(&format!(
+            r"([a-z0-9)/]|[A-Z]{{2}})\.\n(?:\d{{1,4}}\n)?\s*({}{}+(?:[ \-]{}+)?,\s+[A-Z]\.)",
+            r"[A-Z\u{00C0}-\u{024F}]", sc, sc,
+        ))
+        .unwrap()
+    });
+    let re = &*AAAI_RE;
 
     // Secondary pattern for organization/non-standard authors: any text followed by ". Year."
     // Uses lazy matching to find the shortest author block before a year.
     // Handles: lowercase orgs (noyb), orgs with digits (FORCE11), dashes, etc.
-    let org_re = Regex::new(
-        r"([a-z0-9)/]|[A-Z]{2})\.\n(?:\d{1,4}\n)?\s*(.{2,200}?\.\s+(?:19|20)\d{2}[a-z]?\.)",
-    )
-    .unwrap();
+    static AAAI_ORG_RE: Lazy<Regex> = Lazy::new(|| {
+        Regex::new(
+            r"([a-z0-9)/]|[A-Z]{2})\.\n(?:\d{1,4}\n)?\s*(.{2,200}?\.\s+(?:19|20)\d{2}[a-z]?\.)",
+        )
+        .unwrap()
+    });
+    let org_re = &*AAAI_ORG_RE;
 
     // Collect boundary matches from both patterns
     struct Boundary {
@@ -2,7 +2,7 @@ use once_cell::sync::Lazy;
 use regex::Regex;
 use std::collections::HashSet;
 
-use crate::config::ParsingConfig;
+use crate::config::{ListOverride, ParsingConfig};
 
 /// Common compound-word suffixes that should keep the hyphen.
 pub(crate) static COMPOUND_SUFFIXES: Lazy<HashSet<&'static str>> = Lazy::new(|| {
@@ -84,10 +84,17 @@ pub(crate) fn fix_hyphenation_with_config(text: &str, config: &ParsingConfig) ->
         Regex::new(r"(?i)([a-z])-(tion|tions|sion|sions|cient|cients|curity|rity|lity|nity|els|ness|ment|ments|ance|ence|ency|ity|ing|ings|ism|isms|ist|ists|ble|able|ible|ure|ures|age|ages|ous|ive|ical|ally|ular|ology|ization|ised|ized|ises|izes|uous)([.\s,;:?!]|$)").unwrap()
     });
 
-    // Resolve compound suffixes: convert defaults to owned Strings for uniform handling
-    let default_suffixes: Vec<String> = COMPOUND_SUFFIXES.iter().map(|s| s.to_string()).collect();
-    let resolved = config.compound_suffixes.resolve(&default_suffixes);
-    let suffix_set: HashSet<String> = resolved.into_iter().collect();
+    // Resolve compound suffixes by reference: the static default set plus any
+    // configured extras, so nothing is copied or rebuilt per call.
+    let (use_defaults, extra_suffixes): (bool, &[String]) = match &config.compound_suffixes {
+        ListOverride::Default => (true, &[]),
+        ListOverride::Replace(v) => (false, v),
+        ListOverride::Extend(v) => (true, v),
+    };
+    let is_compound_suffix = |word: &str| {
+        (use_defaults && COMPOUND_SUFFIXES.contains(word))
+            || extra_suffixes.iter().any(|s| s == word)
+    };
 
     let result = RE
         .replace_all(text, |caps: &regex::Captures| {
@@ -105,19 +112,9 @@ pub(crate) fn fix_hyphenation_with_config(text: &str, config: &ParsingConfig) ->
                 return format!("{}-{}", before, after_word);
             }
 
-            // Check if the word after the hyphen is a common compound suffix
-            for suffix in suffix_set.iter() {
-                if after_lower == *suffix
-                    || after_lower.starts_with(&format!("{} ", suffix))
-                    || after_lower.starts_with(&format!("{},", suffix))
-                {
-                    return format!("{}-{}", before, after_word);
-                }
-            }
-
-            // Check if the full word (stripped of trailing punctuation) matches a suffix
-            let stripped = after_lower.trim_end_matches(['.', ',', ';', ':']);
-            if suffix_set.contains(stripped) {
+            // Check if the word after the hyphen is a common compound suffix.
+            // `after_word` is all word characters, so an exact lookup suffices.
+            if is_compound_suffix(&after_lower) {
                 return format!("{}-{}", before, after_word);
             }
 
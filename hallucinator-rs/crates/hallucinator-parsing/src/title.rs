@@ -1,5 +1,7 @@
+use aho_corasick::AhoCorasick;
 use once_cell::sync::Lazy;
 use regex::Regex;
+use std::borrow::Cow;
 use std::collections::HashSet;
 
 use crate::config::ParsingConfig;
@@ -219,82 +221,37 @@ pub(crate) fn clean_title_with_config(
         title = truncate_at_sentence_end(&title);
     }
 
-    // Handle "? In" and "? In:" patterns
-    static IN_VENUE_RE: Lazy<Regex> =
-        Lazy::new(|| Regex::new(r"\?\s*[Ii]n:?\s+(?:[A-Z]|[12]\d{3}\s)").unwrap());
-    if let Some(m) = IN_VENUE_RE.find(&title) {
-        // Keep the question mark
-        let qmark_pos = title[..m.end()].rfind('?').unwrap();
-        title = title[..=qmark_pos].to_string();
-    }
-
-    // Handle "? JournalName, vol(issue)" — journal name bleeding after question mark
-    static QMARK_JOURNAL_RE: Lazy<Regex> = Lazy::new(|| {
-        Regex::new(r"[?!]\s+[A-Z][a-zA-Z\s&+\u{00AE}\u{2013}\u{2014}\-]+,\s*(?:vol\.?\s*)?\d+")
-            .unwrap()
-    });
-    if let Some(m) = QMARK_JOURNAL_RE.find(&title) {
-        let punct_pos = title[..m.end()].rfind(['?', '!']).unwrap();
-        title = title[..=punct_pos].to_string();
-    }
-
-    // Handle "? Automatica 34(" or "? IEEE Trans... 53(" — journal + volume with parens
-    static QMARK_JOURNAL_VOL_RE: Lazy<Regex> = Lazy::new(|| {
-        Regex::new(
-            r"[?!]\s+(?:IEEE\s+Trans[a-z.]*|ACM\s+Trans[a-z.]*|Automatica|J\.\s*[A-Z][a-z]+|[A-Z][a-z]+\.?\s+[A-Z][a-z]+\.?)\s+\d+\s*[(\[]",
-        )
-        .unwrap()
-    });
-    if let Some(m) = QMARK_JOURNAL_VOL_RE.find(&title) {
-        let punct_pos = title[..m.end()].rfind(['?', '!']).unwrap();
-        title = title[..=punct_pos].to_string();
-    }
-
-    // Handle "? IEEE Trans. Aut. Contr. 53" — abbreviated journal + volume, no parens
-    static QMARK_ABBREV_JOURNAL_RE: Lazy<Regex> = Lazy::new(|| {
-        Regex::new(r"[?!]\s+(?:IEEE|ACM|SIAM)\s+Trans[a-z.]*(?:\s+[A-Z][a-z]+\.?)+\s+\d+").unwrap()
-    });
-    if let Some(m) = QMARK_ABBREV_JOURNAL_RE.find(&title) {
-        let punct_pos = title[..m.end()].rfind(['?', '!']).unwrap();
-        title = title[..=punct_pos].to_string();
-    }
-
-    // FIX 1 (NeurIPS): Broader venue/conference names after ?/! punctuation
-    static VENUE_AFTER_PUNCTUATION_RE: Lazy<Regex> = Lazy::new(|| {
-        Regex::new(
-            r"[?!]\s+(?:International|Proceedings|Conference|Workshop|Symposium|Association|The\s+\d{4}\s+Conference|Nations|Annual|IEEE|ACM|USENIX|AAAI|NeurIPS|ICML|ICLR|CVPR|ICCV|ECCV|ACL|EMNLP|NAACL)",
-        )
+    // Venue leaking in after a title-ending "?" or "!". One alternation, so a
+    // single search finds the earliest cut point; no branch can match across
+    // another "?"/"!", so this cuts exactly where applying each in turn would.
+    // The shared `[?!]\s+` prefix is factored out of the venue branches.
+    static QMARK_VENUE_RE: Lazy<Regex> = Lazy::new(|| {
+        Regex::new(concat!(
+            // "? In" and "? In:" patterns
+            r"\?\s*[Ii]n:?\s+(?:[A-Z]|[12]\d{3}\s)",
+            r"|[?!]\s+(?:",
+            // "? JournalName, vol(issue)" — journal name bleeding after question mark
+            r"[A-Z][a-zA-Z\s&+\u{00AE}\u{2013}\u{2014}\-]+,\s*(?:vol\.?\s*)?\d+",
+            // "? Automatica 34(" or "? IEEE Trans... 53(" — journal + volume with parens
+            r"|(?:IEEE\s+Trans[a-z.]*|ACM\s+Trans[a-z.]*|Automatica|J\.\s*[A-Z][a-z]+|[A-Z][a-z]+\.?\s+[A-Z][a-z]+\.?)\s+\d+\s*[(\[]",
+            // "? IEEE Trans. Aut. Contr. 53" — abbreviated journal + volume, no parens
+            r"|(?:IEEE|ACM|SIAM)\s+Trans[a-z.]*(?:\s+[A-Z][a-z]+\.?)+\s+\d+",
+            // FIX 1 (NeurIPS): Broader venue/conference names after ?/! punctuation
+            r"|(?:International|Proceedings|Conference|Workshop|Symposium|Association|The\s+\d{4}\s+Conference|Nations|Annual|IEEE|ACM|USENIX|AAAI|NeurIPS|ICML|ICLR|CVPR|ICCV|ECCV|ACL|EMNLP|NAACL)",
+            // "? ACRONYM, year" — ALL-CAPS venue acronym + comma + 4-digit year
+            // (PACMPL, JMLR, VLDB, etc. that aren't in the explicit list above)
+            r"|[A-Z]{3,}[a-z]?\s*,\s*(?:19|20)\d{2}",
+            // Multi-word venues like "! IACR Cryptology ePrint Archive, 2021"
+            r"|(?:IACR|Cryptology\s+ePrint|ePrint\s+Archive)\b",
+            // "? The American Economic Review" — full journal name starting with "The"
+            r"|The\s+[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)+",
+            r")",
+        ))
         .unwrap()
     });
-    if let Some(m) = VENUE_AFTER_PUNCTUATION_RE.find(&title) {
-        let punct_pos = title[..m.end()].rfind(['?', '!']).unwrap();
-        title = title[..=punct_pos].to_string();
-    }
-
-    // Handle "? ACRONYM, year" — ALL-CAPS venue acronym + comma + 4-digit year after ?/!
-    // Catches venues like PACMPL, JMLR, VLDB, etc. that aren't in the explicit list above
-    static QMARK_ACRONYM_VENUE_RE: Lazy<Regex> =
-        Lazy::new(|| Regex::new(r"[?!]\s+[A-Z]{3,}[a-z]?\s*,\s*(?:19|20)\d{2}").unwrap());
-    if let Some(m) = QMARK_ACRONYM_VENUE_RE.find(&title) {
-        let punct_pos = title[..m.end()].rfind(['?', '!']).unwrap();
-        title = title[..=punct_pos].to_string();
-    }
-
-    // Handle multi-word venues after ?/! like "! IACR Cryptology ePrint Archive, 2021"
-    static QMARK_MULTIWORD_VENUE_RE: Lazy<Regex> = Lazy::new(|| {
-        Regex::new(r"[?!]\s+(?:IACR|Cryptology\s+ePrint|ePrint\s+Archive)\b.*$").unwrap()
-    });
-    if let Some(m) = QMARK_MULTIWORD_VENUE_RE.find(&title) {
-        let punct_pos = title[..m.end()].rfind(['?', '!']).unwrap();
-        title = title[..=punct_pos].to_string();
-    }
-
-    // Handle "? The American Economic Review" — full journal name starting with "The" after ?/!
-    static QMARK_THE_JOURNAL_RE: Lazy<Regex> =
-        Lazy::new(|| Regex::new(r"[?!]\s+The\s+[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)+").unwrap());
-    if let Some(m) = QMARK_THE_JOURNAL_RE.find(&title) {
-        let punct_pos = title[..m.end()].rfind(['?', '!']).unwrap();
-        title = title[..=punct_pos].to_string();
+    if let Some(m) = QMARK_VENUE_RE.find(&title) {
+        // Keep the question mark / exclamation point
+        title.truncate(m.start() + 1);
     }
 
     // Remove editor lists: ". In Name, Name, and Name, editors, Venue"
@@ -456,9 +413,7 @@ fn try_quoted_title_with_config(ref_text: &str, config: &ParsingConfig) -> Optio
         ]
     });
 
-    let resolved = config.quote_patterns.resolve(&DEFAULT_QUOTE_PATTERNS);
-
-    for re in resolved.iter() {
+    for re in config.quote_patterns.iter(&DEFAULT_QUOTE_PATTERNS) {
         if let Some(caps) = re.captures(ref_text) {
             let quoted_part = caps.get(1).unwrap().as_str().trim();
             let before_quote = ref_text[..caps.get(0).unwrap().start()].trim();
@@ -728,24 +683,31 @@ fn is_likely_author_list(text: &str) -> bool {
         return false;
     }
 
-    static AUTHOR_LIST_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| {
-        vec![
-            // SURNAME, I., SURNAME, I.
-            Regex::new(r"^[A-Z]{2,}\s*,\s*[A-Z]\.\s*,\s*[A-Z]{2,}\s*,\s*[A-Z]\.").unwrap(),
-            // SURNAME, I., AND SURNAME
-            Regex::new(r"^[A-Z]{2,}\s*,\s*[A-Z]\.\s*,?\s*AND\s+[A-Z]").unwrap(),
-            // SURNAME, AND I. SURNAME
-            Regex::new(r"^[A-Z]{2,}\s*,\s*AND\s+[A-Z]\.\s*[A-Z]").unwrap(),
-            // EL HOUSNI AND G. BOTREL (multi-word surname + AND)
-            Regex::new(r"^[A-Z]{2,}\s+[A-Z]{2,}\s+AND\s+[A-Z]\.\s*[A-Z]").unwrap(),
-            // SURNAME AND SURNAME, (two ALL CAPS surnames)
-            Regex::new(r"^[A-Z]{2,}\s+AND\s+[A-Z]\.\s*[A-Z]{2,}\s*,").unwrap(),
-            // Broken umlaut: B ¨UNZ, P. (diacritic separated from letter)
-            Regex::new(r"^[A-Z]\s*[\u{00A8}\u{00B4}\u{0060}]\s*[A-Z]+\s*,\s*[A-Z]\.").unwrap(),
-        ]
+    // One alternation instead of a pattern list, so each check is a single
+    // scan. Branches sharing the leading "SURNAME," / "SURNAME " are factored.
+    static AUTHOR_LIST_RE: Lazy<Regex> = Lazy::new(|| {
+        Regex::new(
+            r"(?x)
+            ^(?:
+                [A-Z]{2,}\s*,\s*(?:
+                    [A-Z]\.\s*(?:
+                        ,\s*[A-Z]{2,}\s*,\s*[A-Z]\.      # SURNAME, I., SURNAME, I.
+                      | ,?\s*AND\s+[A-Z]                 # SURNAME, I., AND SURNAME
+                    )
+                  | AND\s+[A-Z]\.\s*[A-Z]                # SURNAME, AND I. SURNAME
+                )
+              | [A-Z]{2,}\s+(?:
+                    [A-Z]{2,}\s+AND\s+[A-Z]\.\s*[A-Z]     # EL HOUSNI AND G. BOTREL
+                  | AND\s+[A-Z]\.\s*[A-Z]{2,}\s*,        # SURNAME AND I. SURNAME,
+                )
+                # Broken umlaut: B ¨UNZ, P. (diacritic separated from letter)
+              | [A-Z]\s*[\u{00A8}\u{00B4}\u{0060}]\s*[A-Z]+\s*,\s*[A-Z]\.
+            )",
+        )
+        .unwrap()
     });
 
-    AUTHOR_LIST_PATTERNS.iter().any(|re| re.is_match(text))
+    AUTHOR_LIST_RE.is_match(text)
 }
 
 fn try_org_doc(ref_text: &str) -> Option<(String, bool)> {
@@ -1252,23 +1214,16 @@ fn try_chinese_allcaps(ref_text: &str) -> Option<(String, bool)> {
     let after_authors_str: String = if let Some(m) = ET_AL.find(ref_text) {
         ref_text[m.end()..].trim().to_string()
     } else {
-        // Find where ALL CAPS author pattern ends by scanning comma-separated parts
-        static AUTHOR_PART: Lazy<Regex> =
-            Lazy::new(|| Regex::new(r"^[A-Z]{2,}(?:\s+[A-Z](?:\s+[A-Z])?)?$").unwrap());
-        let parts: Vec<&str> = ref_text.split(", ").collect();
-        let mut title_start_idx = None;
-        for (i, part) in parts.iter().enumerate() {
-            let trimmed = part.trim();
-            if AUTHOR_PART.is_match(trimmed) {
-                continue;
-            }
-            title_start_idx = Some(i);
-            break;
-        }
-        match title_start_idx {
-            Some(idx) => parts[idx..].join(", ").trim().to_string(),
-            None => return None,
+        // Find where the leading run of ALL CAPS authors ends; the title starts
+        // at the first comma-separated part that is not an author
+        static AUTHORS: Lazy<Regex> = Lazy::new(|| {
+            Regex::new(r"^(?:\s*[A-Z]{2,}(?:\s+[A-Z](?:\s+[A-Z])?)?\s*(?:, |$))*").unwrap()
+        });
+        let authors_end = AUTHORS.find(ref_text).map_or(0, |m| m.end());
+        if authors_end == ref_text.len() {
+            return None;
         }
+        ref_text[authors_end..].trim().to_string()
     };
 
     if after_authors_str.is_empty() {
@@ -1276,26 +1231,29 @@ fn try_chinese_allcaps(ref_text: &str) -> Option<(String, bool)> {
     }
 
     // Find where title ends — at Chinese citation markers or venue patterns
-    static TITLE_END_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| {
-        vec![
-            Regex::new(r"\[J\]").unwrap(), // Chinese: journal
-            Regex::new(r"\[C\]").unwrap(), // Chinese: conference
-            Regex::new(r"\[M\]").unwrap(), // Chinese: book/monograph
-            Regex::new(r"\[D\]").unwrap(), // Chinese: dissertation
-            Regex::new(r"\.\s*[A-Z][a-zA-Z\s]+\d+\s*\(\d+\)").unwrap(), // ". Journal 34(5)"
-            Regex::new(r"\.\s*[A-Z][a-zA-Z\s&+]+\d+:\d+").unwrap(), // ". Journal 34:123"
-            Regex::new(r"\.\s*[A-Z][a-zA-Z\s&+]+,\s*\d+").unwrap(), // ". Journal, vol"
-            Regex::new(r"\.\s*(?:19|20)\d{2}").unwrap(), // ". 2024"
-            Regex::new(r"\.\s*https?://").unwrap(),
-            Regex::new(r"\.\s*doi:").unwrap(),
-        ]
+    static CITATION_MARKERS: Lazy<AhoCorasick> = Lazy::new(|| {
+        // [J]=journal, [C]=conference, [M]=book/monograph, [D]=dissertation
+        AhoCorasick::new(["[J]", "[C]", "[M]", "[D]"]).unwrap()
+    });
+    static TITLE_END: Lazy<Regex> = Lazy::new(|| {
+        Regex::new(concat!(
+            r"\.\s*[A-Z][a-zA-Z\s]+\d+\s*\(\d+\)", // ". Journal 34(5)"
+            r"|\.\s*[A-Z][a-zA-Z\s&+]+\d+:\d+",    // ". Journal 34:123"
+            r"|\.\s*[A-Z][a-zA-Z\s&+]+,\s*\d+",    // ". Journal, vol"
+            r"|\.\s*(?:19|20)\d{2}",               // ". 2024"
+            r"|\.\s*https?://",
+            r"|\.\s*doi:",
+        ))
+        .unwrap()
     });
 
-    let mut title_end = after_authors_str.len();
-    for re in TITLE_END_PATTERNS.iter() {
-        if let Some(m) = re.find(&after_authors_str) {
-            title_end = title_end.min(m.start());
-        }
+    // None of the venue patterns can match across a '[', so only the text
+    // before the first citation marker needs scanning.
+    let mut title_end = CITATION_MARKERS
+        .find(&after_authors_str)
+        .map_or(after_authors_str.len(), |m| m.start());
+    if let Some(m) = TITLE_END.find(&after_authors_str[..title_end]) {
+        title_end = m.start();
     }
 
     let title = after_authors_str[..title_end].trim();
@@ -1382,10 +1340,26 @@ fn try_bracket_code(ref_text: &str) -> Option<(String, bool)> {
         if AUTHOR_END_RE.is_match(sent) {
             let next = &sentences[i + 1];
             if !IN_START_RE.is_match(next) && next.starts_with(|c: char| c.is_uppercase()) {
-                // Found the title. Reconstruct it and find where it ends (at "In Venue")
-                let remaining: String = sentences[i + 1..].join(". ");
-                let title_end = remaining.find(". In ").unwrap_or(remaining.len());
-                let title = remaining[..title_end].trim();
+                // Found the title. Reconstruct it and find where it ends (at "In Venue").
+                // Sentences are appended only until ". In " appears, re-scanning just
+                // the few bytes before each join, instead of joining the whole tail.
+                let mut remaining = String::new();
+                let mut title_end = None;
+                for (k, sentence) in sentences[i + 1..].iter().enumerate() {
+                    let mut from = remaining.len().saturating_sub(4);
+                    while !remaining.is_char_boundary(from) {
+                        from -= 1;
+                    }
+                    if k > 0 {
+                        remaining.push_str(". ");
+                    }
+                    remaining.push_str(sentence);
+                    if let Some(pos) = remaining[from..].find(". In ") {
+                        title_end = Some(from + pos);
+                        break;
+                    }
+                }
+                let title = remaining[..title_end.unwrap_or(remaining.len())].trim();
                 if !title.is_empty() {
                     return Some((title.to_string(), false));
                 }
@@ -2138,13 +2112,12 @@ pub(crate) static DEFAULT_CUTOFF_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| {
 });
 
 fn apply_cutoff_patterns_with_config(title: &str, config: &ParsingConfig) -> String {
-    let patterns = config
-        .venue_cutoff_patterns
-        .resolve(&DEFAULT_CUTOFF_PATTERNS);
-
     let mut result = title.to_string();
-    for re in patterns.iter() {
-        result = re.replace(&result, "").to_string();
+    for re in config.venue_cutoff_patterns.iter(&DEFAULT_CUTOFF_PATTERNS) {
+        // Only reallocate when the pattern actually cut something.
+        if let Cow::Owned(cut) = re.replace(&result, "") {
+            result = cut;
+        }
     }
     result
 }
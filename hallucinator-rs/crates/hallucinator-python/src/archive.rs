@@ -109,8 +109,8 @@ impl PyArchiveIterator {
 impl PyArchiveIterator {
     /// Warnings emitted during extraction (e.g. size limit reached).
     #[getter]
-    fn warnings(&self) -> Vec<String> {
-        self.warnings.clone()
+    fn warnings(&self) -> Vec<&str> {
+        self.warnings.iter().map(String::as_str).collect()
     }
 
     fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
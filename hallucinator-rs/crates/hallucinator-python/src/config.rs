@@ -280,8 +280,8 @@ impl PyValidatorConfig {
 
     /// List of database names to skip (e.g. ``["openalex"]``).
     #[getter]
-    fn get_disabled_dbs(&self) -> Vec<String> {
-        self.disabled_dbs.clone()
+    fn get_disabled_dbs(&self) -> Vec<&str> {
+        self.disabled_dbs.iter().map(String::as_str).collect()
     }
 
     #[setter]
@@ -1,9 +1,10 @@
 use std::path::PathBuf;
+use std::sync::OnceLock;
 
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 
-use hallucinator_core::PdfBackend;
+use hallucinator_core::{ExtractionResult, PdfBackend, Reference, SkipStats};
 use hallucinator_parsing::{ParsingConfigBuilder, ReferenceExtractor};
 
 #[cfg(feature = "pdf")]
@@ -15,7 +16,7 @@ use crate::types::{PyExtractionResult, PyReference};
 ///
 /// Set properties to customize regex patterns and thresholds, then call
 /// extraction methods. The config is compiled lazily on first use after
-/// any change (dirty flag pattern).
+/// any change (dirty flag pattern). Extraction methods release the GIL.
 ///
 /// Example::
 ///
@@ -27,26 +28,34 @@ use crate::types::{PyExtractionResult, PyReference};
 #[pyclass(name = "NativePdfExtractor")]
 pub struct PyPdfExtractor {
     builder: ParsingConfigBuilder,
-    cached: Option<ReferenceExtractor>,
+    cached: OnceLock<ReferenceExtractor>,
 }
 
 impl PyPdfExtractor {
     /// Get or rebuild the underlying Rust extractor.
-    fn extractor(&mut self) -> PyResult<&ReferenceExtractor> {
-        if self.cached.is_none() {
-            let config = self
-                .builder
-                .clone()
-                .build()
-                .map_err(|e| PyValueError::new_err(format!("Invalid regex: {}", e)))?;
-            self.cached = Some(ReferenceExtractor::with_config(config));
+    fn extractor(&self) -> PyResult<&ReferenceExtractor> {
+        if let Some(ext) = self.cached.get() {
+            return Ok(ext);
         }
-        Ok(self.cached.as_ref().unwrap())
+        let config = self
+            .builder
+            .clone()
+            .build()
+            .map_err(|e| PyValueError::new_err(format!("Invalid regex: {}", e)))?;
+        Ok(self
+            .cached
+            .get_or_init(|| ReferenceExtractor::with_config(config)))
     }
 
     /// Mark config as dirty so the extractor is rebuilt on next use.
     fn invalidate(&mut self) {
-        self.cached = None;
+        self.cached = OnceLock::new();
+    }
+
+    /// Apply a change to the builder (moved, not cloned) and mark config dirty.
+    fn update(&mut self, f: impl FnOnce(ParsingConfigBuilder) -> ParsingConfigBuilder) {
+        self.builder = f(std::mem::take(&mut self.builder));
+        self.invalidate();
     }
 }
 
@@ -56,7 +65,7 @@ impl PyPdfExtractor {
     fn new() -> Self {
         Self {
             builder: ParsingConfigBuilder::new(),
-            cached: None,
+            cached: OnceLock::new(),
         }
     }
 
@@ -65,96 +74,79 @@ impl PyPdfExtractor {
     /// Set the regex for locating the references section header.
     #[setter]
     fn set_section_header_regex(&mut self, pattern: &str) {
-        self.builder = self.builder.clone().section_header_regex(pattern);
-        self.invalidate();
+        self.update(|b| b.section_header_regex(pattern));
     }
 
     /// Set the regex for finding section end markers.
     #[setter]
     fn set_section_end_regex(&mut self, pattern: &str) {
-        self.builder = self.builder.clone().section_end_regex(pattern);
-        self.invalidate();
+        self.update(|b| b.section_end_regex(pattern));
     }
 
     /// Set the fallback fraction (0.0–1.0) for when no header is found.
     #[setter]
     fn set_fallback_fraction(&mut self, fraction: f64) {
-        self.builder = self.builder.clone().fallback_fraction(fraction);
-        self.invalidate();
+        self.update(|b| b.fallback_fraction(fraction));
     }
 
     /// Set the regex for IEEE-style segmentation.
     #[setter]
     fn set_ieee_segment_regex(&mut self, pattern: &str) {
-        self.builder = self.builder.clone().ieee_segment_regex(pattern);
-        self.invalidate();
+        self.update(|b| b.ieee_segment_regex(pattern));
     }
 
     /// Set the regex for numbered-list segmentation.
     #[setter]
     fn set_numbered_segment_regex(&mut self, pattern: &str) {
-        self.builder = self.builder.clone().numbered_segment_regex(pattern);
-        self.invalidate();
+        self.update(|b| b.numbered_segment_regex(pattern));
     }
 
     /// Set the regex for fallback double-newline segmentation.
     #[setter]
     fn set_fallback_segment_regex(&mut self, pattern: &str) {
-        self.builder = self.builder.clone().fallback_segment_regex(pattern);
-        self.invalidate();
+        self.update(|b| b.fallback_segment_regex(pattern));
     }
 
     /// Set the minimum number of words a title must have.
     #[setter]
     fn set_min_title_words(&mut self, n: usize) {
-        self.builder = self.builder.clone().min_title_words(n);
-        self.invalidate();
+        self.update(|b| b.min_title_words(n));
     }
 
     /// Set the maximum number of authors to retain per reference.
     #[setter]
     fn set_max_authors(&mut self, n: usize) {
-        self.builder = self.builder.clone().max_authors(n);
-        self.invalidate();
+        self.update(|b| b.max_authors(n));
     }
 
     /// Add an extra venue cutoff pattern (appended to defaults).
     fn add_venue_cutoff_pattern(&mut self, pattern: &str) {
-        self.builder = self
-            .builder
-            .clone()
-            .add_venue_cutoff_pattern(pattern.to_string());
-        self.invalidate();
+        self.update(|b| b.add_venue_cutoff_pattern(pattern.to_string()));
     }
 
     /// Replace all venue cutoff patterns with the given list.
     fn set_venue_cutoff_patterns(&mut self, patterns: Vec<String>) {
-        self.builder = self.builder.clone().set_venue_cutoff_patterns(patterns);
-        self.invalidate();
+        self.update(|b| b.set_venue_cutoff_patterns(patterns));
     }
 
     /// Add an extra quote detection pattern (appended to defaults).
     fn add_quote_pattern(&mut self, pattern: &str) {
-        self.builder = self.builder.clone().add_quote_pattern(pattern.to_string());
-        self.invalidate();
+        self.update(|b| b.add_quote_pattern(pattern.to_string()));
     }
 
     /// Replace all quote patterns with the given list.
     fn set_quote_patterns(&mut self, patterns: Vec<String>) {
-        self.builder = self.builder.clone().set_quote_patterns(patterns);
-        self.invalidate();
+        self.update(|b| b.set_quote_patterns(patterns));
     }
 
     /// Add an extra compound suffix (appended to defaults).
     fn add_compound_suffix(&mut self, suffix: &str) {
-        self.builder = self.builder.clone().add_compound_suffix(suffix.to_string());
-        self.invalidate();
+        self.update(|b| b.add_compound_suffix(suffix.to_string()));
     }
 
     /// Replace all compound suffixes with the given list.
     fn set_compound_suffixes(&mut self, suffixes: Vec<String>) {
-        self.builder = self.builder.clone().set_compound_suffixes(suffixes);
-        self.invalidate();
+        self.update(|b| b.set_compound_suffixes(suffixes));
     }
 
     // ── Extraction methods ──
@@ -162,10 +154,14 @@ impl PyPdfExtractor {
     /// Run the full extraction pipeline on a PDF file.
     ///
     /// Returns an `ExtractionResult` with `.references` and `.skip_stats`.
+    /// The GIL is released while the PDF is read and parsed.
     #[cfg(feature = "pdf")]
-    fn extract(&mut self, path: &str) -> PyResult<PyExtractionResult> {
-        let result = hallucinator_ingest::extract_references(&PathBuf::from(path))
-            .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
+    fn extract(&self, py: Python<'_>, path: &str) -> PyResult<PyExtractionResult> {
+        let path = PathBuf::from(path);
+        let result = py.allow_threads(move || {
+            hallucinator_ingest::extract_references(&path)
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
+        })?;
         Ok(PyExtractionResult::from(result))
     }
 
@@ -205,24 +201,27 @@ impl PyPdfExtractor {
     }
 
     /// Extract raw text from a PDF file (step 1).
+    ///
+    /// The GIL is released while the PDF is read.
     #[cfg(feature = "pdf")]
-    fn extract_text(&mut self, path: &str) -> PyResult<String> {
-        let backend = hallucinator_pdf_mupdf::MupdfBackend;
-        backend
-            .extract_text(&PathBuf::from(path))
-            .map_err(backend_error_to_py)
+    fn extract_text(&self, py: Python<'_>, path: &str) -> PyResult<String> {
+        let path = PathBuf::from(path);
+        py.allow_threads(move || {
+            let backend = hallucinator_pdf_mupdf::MupdfBackend;
+            backend.extract_text(&path).map_err(backend_error_to_py)
+        })
     }
 
     /// Locate the references section in document text (step 2).
-    fn find_section(&mut self, text: &str) -> PyResult<Option<String>> {
+    fn find_section(&self, py: Python<'_>, text: &str) -> PyResult<Option<String>> {
         let ext = self.extractor()?;
-        Ok(ext.find_references_section(text))
+        Ok(py.allow_threads(|| ext.find_references_section(text)))
     }
 
     /// Segment a references section into individual reference strings (step 3).
-    fn segment(&mut self, text: &str) -> PyResult<Vec<String>> {
+    fn segment(&self, py: Python<'_>, text: &str) -> PyResult<Vec<String>> {
         let ext = self.extractor()?;
-        Ok(ext.segment_references(text))
+        Ok(py.allow_threads(|| ext.segment_references(text)))
     }
 
     /// Parse a single reference string (step 4).
@@ -231,13 +230,14 @@ impl PyPdfExtractor {
     /// `prev_authors` is used for em-dash "same authors" handling.
     #[pyo3(signature = (text, prev_authors=None))]
     fn parse_reference(
-        &mut self,
+        &self,
+        py: Python<'_>,
         text: &str,
         prev_authors: Option<Vec<String>>,
     ) -> PyResult<Option<PyReference>> {
         let ext = self.extractor()?;
         let prev = prev_authors.unwrap_or_default();
-        let parsed = ext.parse_reference(text, &prev);
+        let parsed = py.allow_threads(|| ext.parse_reference(text, &prev));
         match parsed {
             hallucinator_parsing::extractor::ParsedRef::Ref(r) => Ok(Some(PyReference::from(r))),
             hallucinator_parsing::extractor::ParsedRef::Skip(..) => Ok(None),
@@ -250,13 +250,14 @@ impl PyPdfExtractor {
     /// `reason` is `"url_only"` or `"short_title"`.
     #[pyo3(signature = (text, prev_authors=None))]
     fn parse_reference_detailed(
-        &mut self,
+        &self,
+        py: Python<'_>,
         text: &str,
         prev_authors: Option<Vec<String>>,
     ) -> PyResult<(Option<PyReference>, Option<String>)> {
         let ext = self.extractor()?;
         let prev = prev_authors.unwrap_or_default();
-        let parsed = ext.parse_reference(text, &prev);
+        let parsed = py.allow_threads(|| ext.parse_reference(text, &prev));
         match parsed {
             hallucinator_parsing::extractor::ParsedRef::Ref(r) => {
                 Ok((Some(PyReference::from(r)), None))
@@ -271,14 +272,69 @@ impl PyPdfExtractor {
         }
     }
 
+    /// Parse a list of reference segments into an `ExtractionResult` (step 4).
+    ///
+    /// Same as calling `parse_reference_detailed` on each segment in order,
+    /// carrying the last non-empty author list forward as `prev_authors`,
+    /// but in one call. Skipped references are counted, not returned.
+    fn parse_segments(
+        &self,
+        py: Python<'_>,
+        segments: Vec<String>,
+    ) -> PyResult<PyExtractionResult> {
+        let ext = self.extractor()?;
+        let result = py.allow_threads(|| {
+            let mut stats = SkipStats {
+                total_raw: segments.len(),
+                ..Default::default()
+            };
+            let mut references: Vec<Reference> = Vec::new();
+            // Index of the last reference with authors; its list is lent, not cloned.
+            let mut prev_authors: Option<usize> = None;
+
+            for seg in &segments {
+                let prev = prev_authors.map_or(&[][..], |i| &references[i].authors[..]);
+                match ext.parse_reference(seg, prev) {
+                    hallucinator_parsing::extractor::ParsedRef::Ref(r) => {
+                        if r.title.is_none() {
+                            stats.no_title += 1;
+                        }
+                        if r.authors.is_empty() {
+                            stats.no_authors += 1;
+                        } else {
+                            prev_authors = Some(references.len());
+                        }
+                        references.push(r);
+                    }
+                    hallucinator_parsing::extractor::ParsedRef::Skip(reason, _, _) => {
+                        match reason {
+                            hallucinator_parsing::extractor::SkipReason::UrlOnly => {
+                                stats.url_only += 1
+                            }
+                            hallucinator_parsing::extractor::SkipReason::ShortTitle => {
+                                stats.short_title += 1
+                            }
+                        }
+                    }
+                }
+            }
+
+            ExtractionResult {
+                references,
+                skip_stats: stats,
+            }
+        });
+        Ok(PyExtractionResult::from(result))
+    }
+
     /// Run extraction on already-extracted text (steps 2–4).
     ///
     /// Useful when you've already extracted text and want to re-parse
     /// with different config.
-    fn extract_from_text(&mut self, text: &str) -> PyResult<PyExtractionResult> {
+    fn extract_from_text(&self, py: Python<'_>, text: &str) -> PyResult<PyExtractionResult> {
         let ext = self.extractor()?;
-        let result = ext
-            .extract_references_from_text(text)
+        let result = py
+            .allow_threads(|| ext.extract_references_from_text(text))
             .map_err(parsing_error_to_py)?;
         Ok(PyExtractionResult::from(result))
     }
@@ -4,6 +4,7 @@ mod archive;
 mod config;
 mod errors;
 mod extractor;
+mod text;
 mod types;
 mod validation_types;
 mod validator;
@@ -22,6 +23,10 @@ fn _native(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<archive::PyArchiveIterator>()?;
     m.add_function(wrap_pyfunction!(archive::is_archive_path, m)?)?;
 
+    // Text utilities
+    m.add_function(wrap_pyfunction!(text::normalize_title, m)?)?;
+    m.add_function(wrap_pyfunction!(text::extract_title, m)?)?;
+
     // Validation pipeline (Phase 2B)
     m.add_class::<config::PyValidatorConfig>()?;
     m.add_class::<validator::PyValidator>()?;
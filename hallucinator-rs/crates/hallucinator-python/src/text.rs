@@ -0,0 +1,20 @@
+use pyo3::prelude::*;
+
+/// Normalize a title for comparison: lowercase ASCII alphanumerics only.
+///
+/// Runs the core matcher's normalization (HTML unescape, separated
+/// diacritics, Greek/math transliteration, NFKD) natively.
+#[pyfunction]
+pub fn normalize_title(title: &str) -> String {
+    hallucinator_core::matching::normalize_title(title)
+}
+
+/// Extract the title from a single reference string.
+///
+/// Runs the native title extractor (quoted, bracket-code, LNCS, particle
+/// author, venue-marker, ... formats) with the default parsing config.
+/// Returns `(title, from_quotes)`; the title is empty if none was found.
+#[pyfunction]
+pub fn extract_title(ref_text: &str) -> (String, bool) {
+    hallucinator_parsing::title::extract_title_from_reference(ref_text)
+}
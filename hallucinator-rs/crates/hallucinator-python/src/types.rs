@@ -67,8 +67,23 @@ impl PyReference {
 
     /// List of author names.
     #[getter]
-    fn authors(&self) -> Vec<String> {
-        self.inner.authors.clone()
+    fn authors(&self) -> Vec<&str> {
+        self.inner.authors.iter().map(String::as_str).collect()
+    }
+
+    /// Author names joined with ", " for display.
+    ///
+    /// Cheaper than ``", ".join(ref.authors)``, which first copies every
+    /// name into a Python list.
+    #[getter]
+    fn authors_display(&self) -> String {
+        self.inner.authors.join(", ")
+    }
+
+    /// Number of authors, without copying the author list.
+    #[getter]
+    fn authors_count(&self) -> usize {
+        self.inner.authors.len()
     }
 
     /// The DOI, if found.
@@ -238,4 +253,16 @@ impl PyExtractionResult {
     fn __len__(&self) -> usize {
         self.inner.references.len()
     }
+
+    /// Materialize a single reference without copying the whole list.
+    fn __getitem__(&self, index: isize) -> PyResult<PyReference> {
+        let len = self.inner.references.len() as isize;
+        let i = if index < 0 { index + len } else { index };
+        if i < 0 || i >= len {
+            return Err(pyo3::exceptions::PyIndexError::new_err(
+                "reference index out of range",
+            ));
+        }
+        Ok(PyReference::from(self.inner.references[i as usize].clone()))
+    }
 }
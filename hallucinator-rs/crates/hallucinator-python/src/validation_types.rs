@@ -1,4 +1,6 @@
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 
 use hallucinator_core::{
     ArxivInfo, CheckStats, DbResult, DbStatus, DoiInfo, ProgressEvent, RetractionInfo, Status,
@@ -42,18 +44,21 @@ impl PyValidationResult {
 
     /// Authors from the parsed reference.
     #[getter]
-    fn ref_authors(&self) -> Vec<String> {
-        self.inner.ref_authors.clone()
+    fn ref_authors(&self) -> Vec<&str> {
+        self.inner.ref_authors.iter().map(String::as_str).collect()
     }
 
     /// Validation status: "verified", "not_found", or "author_mismatch".
+    ///
+    /// Returned as an interned string, so no new object is built per access.
     #[getter]
-    fn status(&self) -> &str {
+    fn status<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
         match self.inner.status {
-            Status::Verified => "verified",
-            Status::NotFound => "not_found",
-            Status::AuthorMismatch => "author_mismatch",
+            Status::Verified => intern!(py, "verified"),
+            Status::NotFound => intern!(py, "not_found"),
+            Status::AuthorMismatch => intern!(py, "author_mismatch"),
         }
+        .clone()
     }
 
     /// The database source that verified this reference, if any.
@@ -64,8 +69,12 @@ impl PyValidationResult {
 
     /// Authors found in the matching database record.
     #[getter]
-    fn found_authors(&self) -> Vec<String> {
-        self.inner.found_authors.clone()
+    fn found_authors(&self) -> Vec<&str> {
+        self.inner
+            .found_authors
+            .iter()
+            .map(String::as_str)
+            .collect()
     }
 
     /// URL of the paper in the matching database, if any.
@@ -76,8 +85,8 @@ impl PyValidationResult {
 
     /// List of database names that failed/timed out.
     #[getter]
-    fn failed_dbs(&self) -> Vec<String> {
-        self.inner.failed_dbs.clone()
+    fn failed_dbs(&self) -> Vec<&str> {
+        self.inner.failed_dbs.iter().map(String::as_str).collect()
     }
 
     /// Per-database query results.
@@ -116,12 +125,20 @@ impl PyValidationResult {
         format!(
             "ValidationResult(title={:?}, status={:?}, source={:?})",
             self.inner.title,
-            self.status(),
+            status_str(&self.inner.status),
             self.inner.source,
         )
     }
 }
 
+fn status_str(s: &Status) -> &'static str {
+    match s {
+        Status::Verified => "verified",
+        Status::NotFound => "not_found",
+        Status::AuthorMismatch => "author_mismatch",
+    }
+}
+
 // ── PyDbResult ──
 
 /// Result from querying a single database backend.
@@ -158,9 +175,20 @@ impl PyDbResult {
     }
 
     /// Query status: "match", "no_match", "author_mismatch", "timeout", "error", "skipped".
+    ///
+    /// Returned as an interned string, so no new object is built per access.
     #[getter]
-    fn status(&self) -> &str {
-        db_status_str(&self.inner.status)
+    fn status<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        match self.inner.status {
+            DbStatus::Match => intern!(py, "match"),
+            DbStatus::NoMatch => intern!(py, "no_match"),
+            DbStatus::AuthorMismatch => intern!(py, "author_mismatch"),
+            DbStatus::Timeout => intern!(py, "timeout"),
+            DbStatus::RateLimited => intern!(py, "rate_limited"),
+            DbStatus::Error => intern!(py, "error"),
+            DbStatus::Skipped => intern!(py, "skipped"),
+        }
+        .clone()
     }
 
     /// Query elapsed time in milliseconds, or None.
@@ -171,8 +199,12 @@ impl PyDbResult {
 
     /// Authors found in this database's record.
     #[getter]
-    fn found_authors(&self) -> Vec<String> {
-        self.inner.found_authors.clone()
+    fn found_authors(&self) -> Vec<&str> {
+        self.inner
+            .found_authors
+            .iter()
+            .map(String::as_str)
+            .collect()
     }
 
     /// URL of the paper in this database, if found.
@@ -354,18 +386,21 @@ impl From<ProgressEvent> for PyProgressEvent {
 #[pymethods]
 impl PyProgressEvent {
     /// The event type string.
+    ///
+    /// Returned as an interned string, so no new object is built per event.
     #[getter]
-    fn event_type(&self) -> &str {
+    fn event_type<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
         match &self.inner {
-            ProgressEvent::Checking { .. } => "checking",
-            ProgressEvent::Result { .. } => "result",
-            ProgressEvent::Warning { .. } => "warning",
-            ProgressEvent::Retrying { .. } => "retrying",
-            ProgressEvent::RetryPass { .. } => "retry_pass",
-            ProgressEvent::DatabaseQueryComplete { .. } => "db_query_complete",
-            ProgressEvent::RateLimitWait { .. } => "rate_limit_wait",
-            ProgressEvent::RateLimitRetry { .. } => "rate_limit_retry",
+            ProgressEvent::Checking { .. } => intern!(py, "checking"),
+            ProgressEvent::Result { .. } => intern!(py, "result"),
+            ProgressEvent::Warning { .. } => intern!(py, "warning"),
+            ProgressEvent::Retrying { .. } => intern!(py, "retrying"),
+            ProgressEvent::RetryPass { .. } => intern!(py, "retry_pass"),
+            ProgressEvent::DatabaseQueryComplete { .. } => intern!(py, "db_query_complete"),
+            ProgressEvent::RateLimitWait { .. } => intern!(py, "rate_limit_wait"),
+            ProgressEvent::RateLimitRetry { .. } => intern!(py, "rate_limit_retry"),
         }
+        .clone()
     }
 
     /// Index of the reference (for checking/result/warning/retrying events).
@@ -1,5 +1,6 @@
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
+use std::sync::{Mutex, PoisonError};
 use tokio_util::sync::CancellationToken;
 
 use hallucinator_core::Reference;
@@ -22,7 +23,8 @@ use crate::validation_types::{PyCheckStats, PyProgressEvent, PyValidationResult}
 pub struct PyValidator {
     config: hallucinator_core::Config,
     runtime: tokio::runtime::Runtime,
-    cancel: CancellationToken,
+    /// Token of the current (or next) check; replaced once cancelled.
+    cancel: Mutex<CancellationToken>,
 }
 
 #[pymethods]
@@ -37,7 +39,7 @@ impl PyValidator {
         Ok(Self {
             config: core_config,
             runtime,
-            cancel: CancellationToken::new(),
+            cancel: Mutex::new(CancellationToken::new()),
         })
     }
 
@@ -63,15 +65,16 @@ impl PyValidator {
         let refs: Vec<Reference> = references.into_iter().map(|r| r.into_inner()).collect();
 
         let config = self.config.clone();
-        let cancel = self.cancel.clone();
 
-        // Reset cancellation token for a fresh run
-        let cancel = if cancel.is_cancelled() {
-            // Token was previously cancelled; create a fresh one
-            // (We can't un-cancel a CancellationToken)
-            CancellationToken::new()
-        } else {
-            cancel
+        // Reset cancellation token for a fresh run. A CancellationToken can't
+        // be un-cancelled, so replace it, and store the replacement so that
+        // cancel() reaches this run.
+        let cancel = {
+            let mut token = self.cancel.lock().unwrap_or_else(PoisonError::into_inner);
+            if token.is_cancelled() {
+                *token = CancellationToken::new();
+            }
+            token.clone()
         };
 
         let runtime = &self.runtime;
@@ -117,8 +120,14 @@ impl PyValidator {
     }
 
     /// Cancel an in-progress check from another thread.
+    ///
+    /// Queries already in flight are abandoned rather than awaited; the
+    /// interrupted references are reported with those databases skipped.
     fn cancel(&self) {
-        self.cancel.cancel();
+        self.cancel
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .cancel();
     }
 
     fn __repr__(&self) -> String {
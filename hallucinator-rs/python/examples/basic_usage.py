@@ -43,7 +43,7 @@ def main():
     # Print each reference
     for i, ref in enumerate(result.references, 1):
         print(f"[{i}] {ref.title}")
-        print(f"    Authors: {', '.join(ref.authors)}")
+        print(f"    Authors: {ref.authors_display}")
         if ref.doi:
             print(f"    DOI: {ref.doi}")
         if ref.arxiv_id:
@@ -7,7 +7,7 @@ and other knobs to handle papers that the defaults don't parse well.
     python examples/custom_regexes.py
 """
 
-from hallucinator import PdfExtractor
+from hallucinator import PdfExtractor, compile_segmenter
 
 
 def spanish_paper_example():
@@ -75,7 +75,7 @@ def short_titles_and_custom_venue():
     )
     if ref:
         print(f"  Title: {ref.title}")
-        print(f"  Authors: {', '.join(ref.authors)}")
+        print(f"  Authors: {ref.authors_display}")
         assert "My Journal" not in ref.title
         print("  (venue correctly excluded from title)")
     print()
@@ -113,7 +113,7 @@ def limit_authors():
         "Proc. IEEE, 2023."
     )
     if ref:
-        print(f"  Authors ({len(ref.authors)}): {', '.join(ref.authors)}")
+        print(f"  Authors ({ref.authors_count}): {ref.authors_display}")
         assert len(ref.authors) <= 3
         print("  (capped at 3)")
     print()
@@ -148,16 +148,13 @@ def custom_callable_strategy():
     help if the format is sufficiently unusual — but a Python callable can
     implement arbitrary splitting logic.
     """
-    import re
-
     print("-- Custom callable segmentation strategy --")
     ext = PdfExtractor()
 
-    def paren_segmenter(text: str) -> list[str] | None:
-        """Split references numbered with parenthesized digits: (1), (2), ..."""
-        parts = re.split(r"\n\s*\(\d+\)\s+", text)
-        parts = [p.strip() for p in parts if p.strip()]
-        return parts if len(parts) >= 3 else None
+    # Split references numbered with parenthesized digits: (1), (2), ...
+    # compile_segmenter compiles the pattern once; any callable
+    # (text: str) -> list[str] | None works as a strategy.
+    paren_segmenter = compile_segmenter(r"\n\s*\(\d+\)\s+")
 
     ext.add_segmentation_strategy(paren_segmenter)
 
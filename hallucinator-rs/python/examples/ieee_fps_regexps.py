@@ -19,6 +19,7 @@ Run this file to test all patterns:
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 
@@ -54,14 +55,17 @@ GREEK_TRANSLITERATIONS = {
 }
 
 
+# Every key is a single code point, so one str.translate() call covers all of
+# them (including multi-letter outputs like "alpha") in a single pass.
+_GREEK_TABLE = str.maketrans(GREEK_TRANSLITERATIONS)
+
+
 def transliterate_greek(text: str) -> str:
     """Transliterate Greek letters to ASCII equivalents.
 
     This should be applied BEFORE NFKD normalization in normalize_title().
     """
-    for greek, latin in GREEK_TRANSLITERATIONS.items():
-        text = text.replace(greek, latin)
-    return text
+    return text.translate(_GREEK_TABLE)
 
 
 def test_greek_transliteration():
@@ -92,32 +96,26 @@ def test_greek_transliteration():
 
 # Rust implementation pattern:
 RUST_GREEK_TRANSLITERATION = '''
-// In normalize_title(), before NFKD normalization:
-let title = title
-    .replace('α', "alpha").replace('Α', "alpha")
-    .replace('β', "beta").replace('Β', "beta")
-    .replace('γ', "gamma").replace('Γ', "gamma")
-    .replace('δ', "delta").replace('Δ', "delta")
-    .replace('ε', "epsilon").replace('Ε', "epsilon")
-    .replace('ζ', "zeta").replace('Ζ', "zeta")
-    .replace('η', "eta").replace('Η', "eta")
-    .replace('θ', "theta").replace('Θ', "theta")
-    .replace('ι', "iota").replace('Ι', "iota")
-    .replace('κ', "kappa").replace('Κ', "kappa")
-    .replace('λ', "lambda").replace('Λ', "lambda")
-    .replace('μ', "mu").replace('Μ', "mu")
-    .replace('ν', "nu").replace('Ν', "nu")
-    .replace('ξ', "xi").replace('Ξ', "xi")
-    .replace('ο', "o").replace('Ο', "o")
-    .replace('π', "pi").replace('Π', "pi")
-    .replace('ρ', "rho").replace('Ρ', "rho")
-    .replace('σ', "sigma").replace('ς', "sigma").replace('Σ', "sigma")
-    .replace('τ', "tau").replace('Τ', "tau")
-    .replace('υ', "upsilon").replace('Υ', "upsilon")
-    .replace('φ', "phi").replace('Φ', "phi")
-    .replace('χ', "chi").replace('Χ', "chi")
-    .replace('ψ', "psi").replace('Ψ', "psi")
-    .replace('ω', "omega").replace('Ω', "omega");
+// In normalize_title(), before NFKD normalization.
+// One Aho-Corasick automaton (built once) replaces the 24-step .replace() chain:
+use aho_corasick::AhoCorasick;
+
+static SYMBOL_TRANSLITERATIONS: &[(&str, &str)] = &[
+    ("α", "alpha"), ("Α", "alpha"),
+    ("β", "beta"), ("Β", "beta"),
+    // ... etc (see full GREEK_TRANSLITERATIONS dict in Python)
+    ("ω", "omega"), ("Ω", "omega"),
+];
+
+static SYMBOL_TRANSLITERATOR: Lazy<AhoCorasick> = Lazy::new(|| {
+    AhoCorasick::new(SYMBOL_TRANSLITERATIONS.iter().map(|(from, _)| from)).unwrap()
+});
+
+let mut out = String::with_capacity(title.len());
+SYMBOL_TRANSLITERATOR.replace_all_with(&title, &mut out, |m, _, dst| {
+    dst.push_str(SYMBOL_TRANSLITERATIONS[m.pattern().as_usize()].1);
+    true
+});
 '''
 
 
@@ -184,33 +182,34 @@ DIACRITIC_COMPOSITIONS = {
     ('^', 'U'): 'Û', ('^', 'u'): 'û',
 }
 
-# Regex to find separated diacritics: diacritic + optional space + letter
-# We handle the leading space separately to preserve word boundaries
-SEPARATED_DIACRITIC_PATTERN = re.compile(r'([¨´`~˜ˇ^])\s*([A-Za-z])')
-# Pattern to remove space BEFORE diacritic when it's part of a word (letter before)
-SPACE_BEFORE_DIACRITIC_PATTERN = re.compile(r'([A-Za-z])\s+([¨´`~˜ˇ^])')
+# Flat lookup keyed on "diacritic + letter" (e.g. "¨U" -> "Ü")
+_COMPOSED = {d + l: c for (d, l), c in DIACRITIC_COMPOSITIONS.items()}
+
+# Single-pass pattern with two branches:
+#   1. whitespace between a letter and a diacritic ("B ¨U") -> removed
+#   2. diacritic + optional space + letter ("¨U", "´ e")  -> composed
+SEPARATED_DIACRITIC_PATTERN = re.compile(
+    r'(?<=[A-Za-z])\s+(?=[¨´`~˜ˇ^])|([¨´`~˜ˇ^])\s*([A-Za-z])'
+)
+
+
+def _compose_diacritic(m: re.Match) -> str:
+    diacritic = m.group(1)
+    if diacritic is None:
+        # Branch 1: drop the space so the diacritic attaches to the word
+        return ''
+    letter = m.group(2)
+    # If no mapping, just remove the diacritic (will be handled by NFKD later)
+    return _COMPOSED.get(diacritic + letter, letter)
 
 
 def fix_separated_diacritics(text: str) -> str:
     """Fix separated diacritics from PDF extraction.
 
-    Converts patterns like "¨U" or "B ¨U" to "Ü" or "BÜ".
+    Converts patterns like "¨U" or "B ¨U" to "Ü" or "BÜ" in one regex pass.
     This should be applied BEFORE NFKD normalization.
     """
-    # First, remove spaces between a letter and a diacritic (like "B ¨" -> "B¨")
-    text = SPACE_BEFORE_DIACRITIC_PATTERN.sub(r'\1\2', text)
-
-    # Then compose diacritic + letter into single character
-    def replace_match(m):
-        diacritic = m.group(1)
-        letter = m.group(2)
-        composed = DIACRITIC_COMPOSITIONS.get((diacritic, letter))
-        if composed:
-            return composed
-        # If no mapping, just remove the diacritic (will be handled by NFKD later)
-        return letter
-
-    return SEPARATED_DIACRITIC_PATTERN.sub(replace_match, text)
+    return SEPARATED_DIACRITIC_PATTERN.sub(_compose_diacritic, text)
 
 
 def test_separated_diacritics():
@@ -247,8 +246,8 @@ def test_separated_diacritics():
 RUST_SEPARATED_DIACRITICS = '''
 // In normalize_title(), before NFKD normalization:
 
+use aho_corasick::AhoCorasick;
 use once_cell::sync::Lazy;
-use regex::Regex;
 use std::collections::HashMap;
 
 static DIACRITIC_COMPOSITIONS: Lazy<HashMap<(&str, &str), &str>> = Lazy::new(|| {
@@ -265,29 +264,39 @@ static DIACRITIC_COMPOSITIONS: Lazy<HashMap<(&str, &str), &str>> = Lazy::new(||
     m
 });
 
-// Step 1: Remove space between letter and diacritic
-static SPACE_BEFORE_DIACRITIC_RE: Lazy<Regex> = Lazy::new(|| {
-    Regex::new(r"([A-Za-z])\s+([¨´`~˜ˇ^])").unwrap()
-});
-
-// Step 2: Compose diacritic + letter
-static SEPARATED_DIACRITIC_RE: Lazy<Regex> = Lazy::new(|| {
-    Regex::new(r"([¨´`~˜ˇ^])\s*([A-Za-z])").unwrap()
+// Standalone diacritic marks; one automaton scan finds all of them
+static DIACRITIC_MARKS: Lazy<AhoCorasick> = Lazy::new(|| {
+    AhoCorasick::new(["¨", "´", "`", "~", "˜", "ˇ", "^"]).unwrap()
 });
 
 fn fix_separated_diacritics(title: &str) -> String {
-    // Step 1: Remove spaces before diacritics (e.g., "B ¨" -> "B¨")
-    let title = SPACE_BEFORE_DIACRITIC_RE.replace_all(title, "$1$2");
-
-    // Step 2: Compose diacritic + letter (e.g., "¨U" -> "Ü")
-    SEPARATED_DIACRITIC_RE.replace_all(&title, |caps: &regex::Captures| {
-        let diacritic = caps.get(1).unwrap().as_str();
-        let letter = caps.get(2).unwrap().as_str();
-        DIACRITIC_COMPOSITIONS
-            .get(&(diacritic, letter))
-            .map(|s| s.to_string())
-            .unwrap_or_else(|| letter.to_string())
-    }).to_string()
+    let mut out = String::with_capacity(title.len());
+    let mut last = 0;
+    for m in DIACRITIC_MARKS.find_iter(title) {
+        // Drop whitespace between a letter and the mark ("B ¨U" -> "B¨U")
+        let before = title[..m.start()].trim_end();
+        let keep_until = if before.ends_with(|c: char| c.is_ascii_alphabetic()) {
+            before.len().max(last)
+        } else {
+            m.start()
+        };
+        out.push_str(&title[last..keep_until]);
+
+        // Compose mark + optional space + letter ("¨U" -> "Ü")
+        let rest = &title[m.end()..];
+        let ws = rest.len() - rest.trim_start().len();
+        if rest[ws..].starts_with(|c: char| c.is_ascii_alphabetic()) {
+            let letter = &rest[ws..ws + 1];
+            let diacritic = &title[m.start()..m.end()];
+            out.push_str(DIACRITIC_COMPOSITIONS.get(&(diacritic, letter)).unwrap_or(&letter));
+            last = m.end() + ws + 1;
+        } else {
+            out.push_str(&title[m.start()..m.end()]);
+            last = m.end();
+        }
+    }
+    out.push_str(&title[last..]);
+    out
 }
 '''
 
@@ -335,14 +344,18 @@ MATH_SYMBOL_REPLACEMENTS = {
 }
 
 
+_MATH_TABLE = str.maketrans(MATH_SYMBOL_REPLACEMENTS)
+
+# Greek + math in one table, for callers that apply both (see normalize_title_enhanced)
+_SYMBOL_TABLE = str.maketrans({**GREEK_TRANSLITERATIONS, **MATH_SYMBOL_REPLACEMENTS})
+
+
 def replace_math_symbols(text: str) -> str:
     """Replace mathematical symbols with ASCII equivalents.
 
     This should be applied BEFORE NFKD normalization.
     """
-    for symbol, replacement in MATH_SYMBOL_REPLACEMENTS.items():
-        text = text.replace(symbol, replacement)
-    return text
+    return text.translate(_MATH_TABLE)
 
 
 def test_math_symbols():
@@ -372,28 +385,18 @@ def test_math_symbols():
 
 # Rust implementation pattern:
 RUST_MATH_SYMBOLS = '''
-// In normalize_title(), before NFKD normalization:
-// (Add to existing infinity replacement)
-let title = title
-    .replace('∞', "infinity")  // existing
-    .replace('√', "sqrt")
-    .replace('≤', "leq")
-    .replace('≥', "geq")
-    .replace('≠', "neq")
-    .replace('±', "pm")
-    .replace('×', "times")
-    .replace('÷', "div")
-    .replace('∑', "sum")
-    .replace('∏', "prod")
-    .replace('∫', "int")
-    .replace('∂', "partial")
-    .replace('∇', "nabla")
-    .replace('∈', "in")
-    .replace('⊂', "subset")
-    .replace('∪', "cup")
-    .replace('∩', "cap")
-    .replace('→', "to")
-    .replace('⇒', "implies");
+// In normalize_title(), before NFKD normalization.
+// Append to SYMBOL_TRANSLITERATIONS (see RUST_GREEK_TRANSLITERATION) so Greek
+// letters and math symbols are rewritten by the same single automaton pass:
+    ("∞", "infinity"),  // existing
+    ("√", "sqrt"),
+    ("≤", "leq"),
+    ("≥", "geq"),
+    ("≠", "neq"),
+    ("±", "pm"),
+    ("×", "times"),
+    // ... etc (see full MATH_SYMBOL_REPLACEMENTS dict in Python)
+    ("⇒", "implies"),
 '''
 
 
@@ -426,17 +429,34 @@ AUTHOR_LIST_PATTERNS = [
     re.compile(r'^[A-Z]\s*[¨´`]\s*[A-Z]+\s*,\s*[A-Z]\.'),
 ]
 
-
+# The same patterns as one alternation, so each check is a single match call.
+# Branches sharing the leading "SURNAME," / "SURNAME " are factored together.
+_AUTHOR_LIST_RE = re.compile(
+    r'^(?:'
+      r'[A-Z]{2,}\s*,\s*(?:'
+        r'[A-Z]\.\s*(?:'
+          r',\s*[A-Z]{2,}\s*,\s*[A-Z]\.'            # SURNAME, I., SURNAME, I.
+          r'|,?\s*AND\s+[A-Z]'                      # SURNAME, I., AND SURNAME
+        r')'
+        r'|AND\s+[A-Z]\.\s*[A-Z]'                   # SURNAME, AND I. SURNAME
+      r')'
+      r'|[A-Z]{2,}\s+(?:'
+        r'[A-Z]{2,}\s+AND\s+[A-Z]\.\s*[A-Z]'        # EL HOUSNI AND G. BOTREL
+        r'|AND\s+[A-Z]\.\s*[A-Z]{2,}\s*,'           # SURNAME AND I. SURNAME,
+      r')'
+      r'|[A-Z]\s*[¨´`]\s*[A-Z]+\s*,\s*[A-Z]\.'      # B ¨UNZ, P.
+    r')'
+)
+
+
+@lru_cache(maxsize=4096)
 def is_likely_author_list(text: str) -> bool:
     """Check if text looks like an author list instead of a title.
 
     Returns True if the text matches common author list patterns.
     This should be used to reject bad title extractions.
     """
-    for pattern in AUTHOR_LIST_PATTERNS:
-        if pattern.match(text):
-            return True
-    return False
+    return _AUTHOR_LIST_RE.match(text) is not None
 
 
 def test_author_list_detection():
@@ -485,17 +505,19 @@ RUST_AUTHOR_LIST_DETECTION = '''
 use once_cell::sync::Lazy;
 use regex::Regex;
 
-static AUTHOR_LIST_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| vec![
-    // SURNAME, I., SURNAME, I., AND SURNAME, I.
-    Regex::new(r"^[A-Z]{2,}\s*,\s*[A-Z]\.\s*,\s*[A-Z]{2,}\s*,\s*[A-Z]\.").unwrap(),
-    // SURNAME, I., AND SURNAME, I.,
-    Regex::new(r"^[A-Z]{2,}\s*,\s*[A-Z]\.\s*,?\s*AND\s+[A-Z]").unwrap(),
-    // Broken umlaut author pattern
-    Regex::new(r"^[A-Z]\s*[¨´`]\s*[A-Z]+\s*,\s*[A-Z]\.").unwrap(),
-]);
+// Single alternation: one scan per check instead of one per pattern.
+static AUTHOR_LIST_RE: Lazy<Regex> = Lazy::new(|| Regex::new(r"(?x)
+    ^(?:
+        [A-Z]{2,}\s*,\s*(?:
+            [A-Z]\.\s*(?: ,\s*[A-Z]{2,}\s*,\s*[A-Z]\. | ,?\s*AND\s+[A-Z] )
+          | AND\s+[A-Z]\.\s*[A-Z]
+        )
+      | [A-Z]{2,}\s+(?: [A-Z]{2,}\s+AND\s+[A-Z]\.\s*[A-Z] | AND\s+[A-Z]\.\s*[A-Z]{2,}\s*, )
+      | [A-Z]\s*[¨´`]\s*[A-Z]+\s*,\s*[A-Z]\.   # broken umlaut
+    )").unwrap());
 
 fn is_likely_author_list(text: &str) -> bool {
-    AUTHOR_LIST_PATTERNS.iter().any(|re| re.is_match(text))
+    AUTHOR_LIST_RE.is_match(text)
 }
 
 // In extract_title(), after extracting:
@@ -527,16 +549,17 @@ DASH_CHARS = {
     '‑': '-',  # non-breaking hyphen
 }
 
+_DASH_TABLE = str.maketrans(DASH_CHARS)
+
 
+@lru_cache(maxsize=4096)
 def normalize_dashes(text: str) -> str:
     """Normalize various dash characters to ASCII hyphen.
 
     This is optional for display purposes. For matching, dashes are
     already stripped by the [^a-zA-Z0-9] filter.
     """
-    for dash, hyphen in DASH_CHARS.items():
-        text = text.replace(dash, hyphen)
-    return text
+    return text.translate(_DASH_TABLE)
 
 
 def test_dash_normalization():
@@ -565,39 +588,47 @@ def test_dash_normalization():
 # COMBINED: Full Normalization Pipeline
 # =============================================================================
 
+# Byte tables for the final filter: keep [A-Za-z0-9], lowercasing as we go
+_ALNUM_BYTES = b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+_NON_ALNUM_BYTES = bytes(b for b in range(256) if b not in _ALNUM_BYTES)
+_LOWERCASE_BYTES = bytes.maketrans(
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', b'abcdefghijklmnopqrstuvwxyz'
+)
+
+
+@lru_cache(maxsize=4096)
 def normalize_title_enhanced(title: str) -> str:
     """Apply all normalization fixes in the correct order.
 
     Order:
     1. Fix separated diacritics (before NFKD can handle them)
-    2. Transliterate Greek letters
-    3. Replace math symbols
-    4. Normalize dashes (optional)
-    5. Then proceed with existing NFKD + ASCII filter
+    2. Transliterate Greek letters and replace math symbols
+    3. NFKD normalization
+    4. Keep only ASCII alphanumerics, lowercased
+
+    Dashes need no step of their own: like all other punctuation they are
+    dropped by step 4.
     """
     import unicodedata
 
+    # Fast path: pure-ASCII titles have nothing to transliterate or decompose,
+    # and composing an ASCII mark (` ~ ^) only yields the base letter after
+    # NFKD, so only the final filter matters
+    if title.isascii():
+        title = title.encode('ascii')
+        return title.translate(_LOWERCASE_BYTES, _NON_ALNUM_BYTES).decode('ascii')
+
     # Step 1: Fix separated diacritics
     title = fix_separated_diacritics(title)
 
-    # Step 2: Transliterate Greek
-    title = transliterate_greek(title)
-
-    # Step 3: Replace math symbols
-    title = replace_math_symbols(title)
-
-    # Step 4: Normalize dashes (optional)
-    title = normalize_dashes(title)
-
-    # Step 5: NFKD normalization and ASCII filter (existing logic)
-    title = unicodedata.normalize('NFKD', title)
-    title = ''.join(c for c in title if c.isascii())
-
-    # Step 6: Keep only alphanumeric, lowercase
-    title = re.sub(r'[^a-zA-Z0-9]', '', title)
-    title = title.lower()
+    # Steps 2-3: One translate pass for Greek + math, then NFKD. The symbols
+    # must go first since NFKD decomposes some of them (e.g. ≠, ∉).
+    title = unicodedata.normalize('NFKD', title.translate(_SYMBOL_TABLE))
 
-    return title
+    # Step 4: Drop non-ASCII in the codec, then one bytes.translate that
+    # deletes non-alphanumerics and lowercases in the same pass
+    title = title.encode('ascii', 'ignore')
+    return title.translate(_LOWERCASE_BYTES, _NON_ALNUM_BYTES).decode('ascii')
 
 
 def test_combined_normalization():
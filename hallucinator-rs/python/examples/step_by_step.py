@@ -60,19 +60,21 @@ def main():
     prev_authors = None
     parsed = 0
     skipped = 0
+    # One line or two per reference: collect them and print once at the end
+    lines = []
     for i, seg in enumerate(segments, 1):
         ref = ext.parse_reference(seg, prev_authors=prev_authors)
         if ref is None:
             skipped += 1
             preview = seg[:80].replace("\n", " ")
-            print(f"  [{i}] SKIPPED: {preview}...")
+            lines.append(f"  [{i}] SKIPPED: {preview}...")
         else:
             parsed += 1
             prev_authors = ref.authors
-            print(f"  [{i}] {ref.title}")
-            print(f"       Authors: {', '.join(ref.authors)}")
-
-    print(f"\nParsed: {parsed}, Skipped: {skipped}")
+            lines.append(f"  [{i}] {ref.title}")
+            lines.append(f"       Authors: {ref.authors_display}")
+    lines.append(f"\nParsed: {parsed}, Skipped: {skipped}")
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -6,6 +6,8 @@ databases. Custom segmentation strategies can be registered to handle
 non-standard reference formats.
 """
 
+import re
+
 from hallucinator._native import (
     NativePdfExtractor,
     Reference,
@@ -15,6 +17,9 @@ from hallucinator._native import (
     ArchiveEntry,
     ArchiveIterator,
     is_archive_path,
+    # Text utilities
+    normalize_title,
+    extract_title,
     # Validation pipeline
     ValidatorConfig,
     Validator,
@@ -30,6 +35,7 @@ from hallucinator._native import (
 __all__ = [
     # PDF extraction
     "PdfExtractor",
+    "compile_segmenter",
     "Reference",
     "ExtractionResult",
     "SkipStats",
@@ -37,6 +43,9 @@ __all__ = [
     "ArchiveEntry",
     "ArchiveIterator",
     "is_archive_path",
+    # Text utilities
+    "normalize_title",
+    "extract_title",
     # Validation pipeline
     "Validator",
     "ValidatorConfig",
@@ -50,6 +59,29 @@ __all__ = [
 ]
 
 
+def compile_segmenter(pattern, min_parts=3):
+    """Build a segmentation strategy that splits on a regex.
+
+    The pattern is compiled once, when the strategy is built, rather than
+    looked up on every call. The returned callable splits the text on
+    ``pattern``, strips each piece and drops empty ones, and returns the
+    pieces, or ``None`` when there are fewer than ``min_parts``.
+
+    Args:
+        pattern: A regex string or a compiled ``re.Pattern`` matching the
+            separator between references. Use non-capturing groups
+            ``(?:...)``; captured text would be returned as extra pieces.
+        min_parts: Minimum number of references for the strategy to apply.
+    """
+    rx = re.compile(pattern)
+
+    def segmenter(text):
+        parts = [p.strip() for p in rx.split(text) if p.strip()]
+        return parts if len(parts) >= min_parts else None
+
+    return segmenter
+
+
 class PdfExtractor:
     """A configurable PDF reference extractor.
 
@@ -66,11 +98,7 @@ class PdfExtractor:
 
     Custom segmentation::
 
-        def paren_segmenter(text: str) -> list[str] | None:
-            import re
-            parts = re.split(r'\\n\\s*\\(\\d+\\)\\s+', text)
-            return parts if len(parts) >= 3 else None
-
+        paren_segmenter = compile_segmenter(r'\\n\\s*\\(\\d+\\)\\s+')
         ext.add_segmentation_strategy(paren_segmenter)
         result = ext.extract_from_text(text)
     """
@@ -90,8 +118,10 @@ class PdfExtractor:
     )
 
     def __init__(self):
-        self._native = NativePdfExtractor()
-        self._custom_strategies = []
+        # Internal attributes are never config names; set them directly
+        # rather than through the forwarding __setattr__.
+        object.__setattr__(self, "_native", NativePdfExtractor())
+        object.__setattr__(self, "_custom_strategies", [])
 
     def __setattr__(self, name, value):
         if name in PdfExtractor._CONFIG_ATTRS:
@@ -129,6 +159,8 @@ class PdfExtractor:
                 Return a list of reference strings if this strategy applies,
                 or ``None`` to fall through to the next strategy.
                 The result must contain at least 3 items to be accepted.
+                For strategies that just split on a regex, build ``fn`` with
+                :func:`compile_segmenter` so the pattern is compiled once.
         """
         self._custom_strategies.append(fn)
 
@@ -148,11 +180,13 @@ class PdfExtractor:
         Tries custom strategies first (in registration order), then
         falls back to the Rust built-in strategies.
         """
-        for strategy in self._custom_strategies:
-            result = strategy(text)
-            if result is not None and len(result) >= 3:
-                return result
-        return self._native.segment(text)
+        if not self._custom_strategies:
+            return self._native.segment(text)
+
+        segments = self._custom_segment(text)
+        if segments is None:
+            return self._native.segment(text)
+        return segments
 
     def parse_reference(self, text, prev_authors=None):
         """Parse a single reference string.
@@ -164,9 +198,10 @@ class PdfExtractor:
     def extract_from_text(self, text):
         """Run the full extraction pipeline on already-extracted text.
 
-        When custom segmentation strategies are registered, the pipeline
-        is orchestrated in Python (find_section -> segment -> parse loop).
-        Otherwise delegates entirely to the fast Rust implementation.
+        When a custom segmentation strategy matches the references section,
+        the pipeline is orchestrated in Python (find_section -> segment ->
+        parse loop). Otherwise delegates entirely to the fast Rust
+        implementation.
         """
         if not self._custom_strategies:
             return self._native.extract_from_text(text)
@@ -175,7 +210,11 @@ class PdfExtractor:
         if section is None:
             return ExtractionResult._from_parts([], 0, 0, 0, 0, 0)
 
-        segments = self.segment(section)
+        segments = self._custom_segment(section)
+        if segments is None:
+            # Every strategy fell through, so the Rust built-ins would
+            # segment anyway: run the whole pipeline in one native call.
+            return self._native.extract_from_text(text)
         return self._parse_segments(segments)
 
     def extract(self, path):
@@ -202,37 +241,17 @@ class PdfExtractor:
 
     # ── Internal ──
 
+    def _custom_segment(self, text):
+        """Return the first accepted custom segmentation, or ``None``."""
+        for strategy in self._custom_strategies:
+            result = strategy(text)
+            if result is not None and len(result) >= 3:
+                return result
+        return None
+
     def _parse_segments(self, segments):
         """Parse a list of reference segments into an ExtractionResult."""
-        refs = []
-        prev_authors = None
-        total_raw = len(segments)
-        url_only = 0
-        short_title = 0
-        no_title = 0
-        no_authors = 0
-
-        for seg in segments:
-            ref, skip_reason = self._native.parse_reference_detailed(
-                seg, prev_authors=prev_authors
-            )
-            if skip_reason:
-                if skip_reason == "url_only":
-                    url_only += 1
-                elif skip_reason == "short_title":
-                    short_title += 1
-            elif ref is not None:
-                if ref.title is None:
-                    no_title += 1
-                if not ref.authors:
-                    no_authors += 1
-                else:
-                    prev_authors = ref.authors
-                refs.append(ref)
-
-        return ExtractionResult._from_parts(
-            refs, total_raw, url_only, short_title, no_title, no_authors
-        )
+        return self._native.parse_segments(segments)
 
     def __repr__(self):
         n = len(self._custom_strategies)
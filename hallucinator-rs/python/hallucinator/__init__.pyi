@@ -1,6 +1,7 @@
 """Type stubs for the hallucinator Python package."""
 
-from typing import Callable, Optional
+import re
+from typing import Callable, Optional, Union
 
 from hallucinator._native import ArxivInfo as ArxivInfo
 from hallucinator._native import CheckStats as CheckStats
@@ -16,6 +17,8 @@ from hallucinator._native import ValidatorConfig as ValidatorConfig
 from hallucinator._native import ArchiveEntry as ArchiveEntry
 from hallucinator._native import ArchiveIterator as ArchiveIterator
 from hallucinator._native import is_archive_path as is_archive_path
+from hallucinator._native import normalize_title as normalize_title
+from hallucinator._native import extract_title as extract_title
 
 class Reference:
     """A parsed reference with structured fields.
@@ -39,6 +42,10 @@ class Reference:
     @property
     def authors(self) -> list[str]: ...
     @property
+    def authors_display(self) -> str: ...
+    @property
+    def authors_count(self) -> int: ...
+    @property
     def doi(self) -> Optional[str]: ...
     @property
     def arxiv_id(self) -> Optional[str]: ...
@@ -47,6 +54,17 @@ class Reference:
     @property
     def skip_reason(self) -> Optional[str]: ...
 
+def compile_segmenter(
+    pattern: Union[str, re.Pattern[str]], min_parts: int = 3
+) -> Callable[[str], Optional[list[str]]]:
+    """Build a segmentation strategy that splits on a regex.
+
+    The pattern is compiled once. The returned callable returns the
+    stripped, non-empty pieces, or ``None`` if there are fewer than
+    ``min_parts``.
+    """
+    ...
+
 class PdfExtractor:
     """A configurable PDF reference extractor with custom strategy support.
 
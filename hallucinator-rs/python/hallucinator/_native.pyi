@@ -12,6 +12,10 @@ class Reference:
     @property
     def authors(self) -> list[str]: ...
     @property
+    def authors_display(self) -> str: ...
+    @property
+    def authors_count(self) -> int: ...
+    @property
     def doi(self) -> Optional[str]: ...
     @property
     def arxiv_id(self) -> Optional[str]: ...
@@ -38,6 +42,7 @@ class ExtractionResult:
     @property
     def skip_stats(self) -> SkipStats: ...
     def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Reference: ...
     @staticmethod
     def _from_parts(
         refs: list[Reference],
@@ -85,8 +90,22 @@ class NativePdfExtractor:
     def parse_reference_detailed(
         self, text: str, prev_authors: Optional[list[str]] = None
     ) -> tuple[Optional[Reference], Optional[str]]: ...
+    def parse_segments(self, segments: list[str]) -> ExtractionResult: ...
     def extract_from_text(self, text: str) -> ExtractionResult: ...
 
+# ── Text utilities ──
+
+def normalize_title(title: str) -> str:
+    """Normalize a title for comparison: lowercase ASCII alphanumerics only."""
+    ...
+
+def extract_title(ref_text: str) -> tuple[str, bool]:
+    """Extract the title from a reference string.
+
+    Returns ``(title, from_quotes)``; ``title`` is empty if none was found.
+    """
+    ...
+
 # ── Validation pipeline ──
 
 class ValidatorConfig:
@@ -2,7 +2,14 @@
 
 import pytest
 
-from hallucinator import PdfExtractor, Reference, ExtractionResult
+from hallucinator import (
+    PdfExtractor,
+    compile_segmenter,
+    Reference,
+    ExtractionResult,
+    extract_title,
+    normalize_title,
+)
 from hallucinator._native import NativePdfExtractor
 
 
@@ -222,6 +229,25 @@ def test_extract_from_text():
     assert "Detecting Fake References" in refs[0].title
 
 
+def test_extract_from_text_shared_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    ext = PdfExtractor()
+    text = (
+        "Body text.\n\nReferences\n"
+        "42\n"
+        '[1] J. Smith, "Detecting Fake References in Academic Papers," '
+        "in Proc. IEEE, 2023.\n"
+        '[2] A. Brown, "Another Important Paper on Machine Learning," '
+        "in Proc. AAAI, 2022.\n"
+        '[3] C. Wilson, "A Third Paper About NLP Systems," '
+        "in Proc. ACL, 2021.\n"
+    )
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(ext.extract_from_text, [text] * 8))
+    assert [len(r) for r in results] == [3] * 8
+
+
 # ── Type checks ──
 
 
@@ -235,6 +261,8 @@ def test_reference_properties():
     assert isinstance(ref.title, str)
     assert isinstance(ref.authors, list)
     assert isinstance(ref.raw_citation, str)
+    assert ref.authors_display == ", ".join(ref.authors)
+    assert ref.authors_count == len(ref.authors)
     # doi/arxiv_id may or may not be found
     assert ref.arxiv_id is None
 
@@ -415,6 +443,41 @@ def test_custom_strategy_too_few_results_falls_through():
     assert len(segs) == 3  # fell through to Rust
 
 
+def test_extract_from_text_fallthrough_matches_fast_path():
+    """When every strategy falls through, extraction matches the Rust fast path."""
+    ext = PdfExtractor()
+    calls = []
+
+    def returns_none(text):
+        calls.append(text)
+        return None
+
+    ext.add_segmentation_strategy(returns_none)
+    result = ext.extract_from_text(IEEE_TEXT)
+    expected = PdfExtractor().extract_from_text(IEEE_TEXT)
+
+    assert len(calls) == 1
+    assert [r.title for r in result.references] == [
+        r.title for r in expected.references
+    ]
+    assert result.skip_stats.total_raw == expected.skip_stats.total_raw
+
+
+def test_compile_segmenter():
+    """compile_segmenter splits on the pattern and strips/drops empty pieces."""
+    seg = compile_segmenter(r"\n\s*\(\d+\)\s+")
+    text = "\n(1) First ref.\n(2) Second ref.\n(3) Third ref.\n"
+    assert seg(text) == ["First ref.", "Second ref.", "Third ref."]
+    assert seg("\n(1) Only one ref.\n") is None
+    assert compile_segmenter(r"\n\s*\(\d+\)\s+", min_parts=1)(
+        "\n(1) Only one ref.\n"
+    ) == ["Only one ref."]
+
+    ext = PdfExtractor()
+    ext.add_segmentation_strategy(seg)
+    assert ext.segment(text) == ["First ref.", "Second ref.", "Third ref."]
+
+
 def test_parse_reference_detailed():
     """parse_reference_detailed returns (ref, None) or (None, reason)."""
     ext = PdfExtractor()
@@ -443,6 +506,25 @@ def test_parse_reference_detailed():
     assert reason == "short_title"
 
 
+def test_parse_segments():
+    """parse_segments parses a segment list in one call, counting skips."""
+    ext = PdfExtractor()
+    segments = [
+        'J. Smith, "Detecting Fake References in Academic Papers," in Proc. IEEE, 2023.',
+        "See https://github.com/some/repo for details.",
+        'J. Smith, "Short Title," publisher, city.',
+        'A. Brown, "Another Important Paper on Machine Learning," in Proc. AAAI, 2022.',
+    ]
+
+    result = ext._native.parse_segments(segments)
+    assert isinstance(result, ExtractionResult)
+    assert len(result) == 2
+    assert "Detecting Fake References" in result.references[0].title
+    assert result.skip_stats.total_raw == 4
+    assert result.skip_stats.url_only == 1
+    assert result.skip_stats.short_title == 1
+
+
 def test_extraction_result_from_parts():
     """ExtractionResult._from_parts() constructs a valid result."""
     ext = PdfExtractor()
@@ -457,3 +539,36 @@ def test_extraction_result_from_parts():
     assert result.skip_stats.url_only == 1
     assert result.skip_stats.short_title == 1
     assert result.references[0].title == ref.title
+    assert result[0].title == ref.title
+    assert result[-1].title == ref.title
+    assert [r.title for r in result] == [ref.title]
+    with pytest.raises(IndexError):
+        result[1]
+
+
+# ── Text utilities ──
+
+
+def test_normalize_title():
+    assert normalize_title("Déjà Vu: Side-Channel Analysis") == "dejavusidechannelanalysis"
+    assert normalize_title("αdiff: Cross-version") == "alphadiffcrossversion"
+    assert normalize_title("B ¨UNZ et al.") == "bunzetal"
+    assert normalize_title("H∞ control") == "hinfinitycontrol"
+
+
+def test_extract_title():
+    title, from_quotes = extract_title(
+        'J. Smith, A. Jones, and C. Williams, "Detecting Fake References in Papers," '
+        "in Proc. IEEE Conf., 2023."
+    )
+    assert from_quotes
+    assert "Detecting Fake References" in title
+
+    title, from_quotes = extract_title(
+        "K. Allix, T. F. Bissyand\u00b4e, J. Klein, and Y. Le Traon. Androzoo: "
+        "Collecting millions of android apps for the research community. In MSR, 2016."
+    )
+    assert not from_quotes
+    assert "Androzoo" in title or "Collecting millions" in title
+
+    assert extract_title("") == ("", False)
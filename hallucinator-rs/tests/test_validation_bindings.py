@@ -330,10 +330,14 @@ def test_crossref_mailto_affects_validator():
 # ── Offline Validation (all DBs disabled, no network) ──
 
 
+# One default-config extractor shared by every _make_ref call; it keeps its
+# built parser between calls instead of rebuilding one per reference.
+_EXTRACTOR = PdfExtractor()
+
+
 def _make_ref(title):
     """Create a reference with the given title using PdfExtractor."""
-    ext = PdfExtractor()
-    ref = ext.parse_reference(
+    ref = _EXTRACTOR.parse_reference(
         f'J. Smith, "{title}," in Proc. IEEE, 2023.'
     )
     return ref